@@ -53,10 +53,24 @@ _EFFECT_TAG_PATTERN = re.compile(
     r"(?:EFFECT|CONSEQUENCE|IMPACT)=([^;]+)", re.IGNORECASE
 )
 
+# Bound search methods used by the extractors, saving an attribute lookup
+# per call on the per-variant hot path.
+_ann_gene_search = _ANN_GENE_PATTERN.search
+_ann_gene_simple_search = _ANN_GENE_SIMPLE_PATTERN.search
+_ann_consequence_search = _ANN_CONSEQUENCE_PATTERN.search
+_csq_gene_search = _CSQ_GENE_PATTERN.search
+_csq_consequence_search = _CSQ_CONSEQUENCE_PATTERN.search
+_gene_tag_search = _GENE_TAG_PATTERN.search
+_effect_tag_search = _EFFECT_TAG_PATTERN.search
+
 # Variant type classification
 _INDEL_PATTERN = re.compile(r"^[ACGTNacgtn]{2,}$")
 
 
+# FILTER values treated as passing by filter_pass_variants
+_PASS_FILTER_VALUES = frozenset(("PASS", ".", ""))
+
+
 # ===================================================================
 # Core Parsers
 # ===================================================================
@@ -193,22 +207,22 @@ def extract_gene_from_info(info: str) -> str:
         return ""
 
     # Try ANN= (SnpEff standard format — gene at position 4)
-    match = _ANN_GENE_PATTERN.search(info)
+    match = _ann_gene_search(info)
     if match:
         return match.group(1).strip()
 
     # Try ANN= (simplified format — gene at position 2)
-    match = _ANN_GENE_SIMPLE_PATTERN.search(info)
+    match = _ann_gene_simple_search(info)
     if match:
         return match.group(1).strip()
 
     # Try CSQ= (VEP)
-    match = _CSQ_GENE_PATTERN.search(info)
+    match = _csq_gene_search(info)
     if match:
         return match.group(1).strip()
 
     # Try GENE= / GENEINFO= tag
-    match = _GENE_TAG_PATTERN.search(info)
+    match = _gene_tag_search(info)
     if match:
         gene = match.group(1).strip()
         # GENEINFO may have format GENE:ID — take just the gene symbol
@@ -242,17 +256,17 @@ def extract_consequence_from_info(info: str) -> str:
         return ""
 
     # Try ANN= (SnpEff) — consequence is in the second pipe field
-    match = _ANN_CONSEQUENCE_PATTERN.search(info)
+    match = _ann_consequence_search(info)
     if match:
         return match.group(1).strip()
 
     # Try CSQ= (VEP)
-    match = _CSQ_CONSEQUENCE_PATTERN.search(info)
+    match = _csq_consequence_search(info)
     if match:
         return match.group(1).strip()
 
     # Try explicit tags
-    match = _EFFECT_TAG_PATTERN.search(info)
+    match = _effect_tag_search(info)
     if match:
         return match.group(1).strip()
 
@@ -280,11 +294,11 @@ def filter_pass_variants(variants: List[Dict]) -> List[Dict]:
     list of dict
         Variants where FILTER is PASS, ".", or empty.
     """
-    pass_variants = []
+    pass_variants: List[Dict] = []
+    _keep = pass_variants.append
     for v in variants:
-        filt = str(v.get("filter", "")).strip().upper()
-        if filt in ("PASS", ".", ""):
-            pass_variants.append(v)
+        if str(v.get("filter", "")).strip().upper() in _PASS_FILTER_VALUES:
+            _keep(v)
 
     logger.info(
         "Filtered to %d PASS variants from %d total",
@@ -307,7 +321,8 @@ def summarize_variants(variants: List[Dict]) -> Dict:
     Parameters
     ----------
     variants : list of dict
-        Parsed variant records with at least ref, alt, and info fields.
+        Parsed variant records with at least ref, alt, and info fields,
+        holding string values as produced by :func:`parse_vcf_text`.
 
     Returns
     -------
@@ -322,35 +337,44 @@ def summarize_variants(variants: List[Dict]) -> Dict:
             - genes_count: Number of unique genes
     """
     total = len(variants)
-    snvs = 0
-    insertions = 0
-    deletions = 0
-    genes: set = set()
+
+    # Allele counters indexed by sign(len(alt) - len(ref)) + 1, plus SNVs:
+    # [deletions, MNV/complex, insertions, SNVs]
+    counts = [0, 0, 0, 0]
+    infos: List[str] = []
+
+    # Bind hot-loop callables to locals (LOAD_FAST instead of global lookup)
+    _len = len
+    _add_info = infos.append
 
     for v in variants:
-        ref = str(v.get("ref", ""))
-        alt = str(v.get("alt", ""))
-        info = str(v.get("info", ""))
+        # parse_vcf_text always yields str values for these columns
+        ref = v.get("ref") or ""
+        alt = v.get("alt") or ""
+        _add_info(v.get("info") or "")
+
+        rlen = _len(ref)
 
         # Handle multi-allelic sites (comma-separated ALT)
-        alt_alleles = alt.split(",")
+        alt_alleles = alt.split(",") if "," in alt else (alt,)
 
         for allele in alt_alleles:
-            allele = allele.strip()
-            if len(ref) == 1 and len(allele) == 1:
-                snvs += 1
-            elif len(ref) < len(allele):
-                insertions += 1
-            elif len(ref) > len(allele):
-                deletions += 1
+            # VCF disallows whitespace in ALT, so only strip when present
+            if allele and (allele[0].isspace() or allele[-1].isspace()):
+                allele = allele.strip()
+            alen = _len(allele)
+            if rlen == 1 and alen == 1:
+                counts[3] += 1
             else:
-                # MNV or complex — count as SNV-like
-                snvs += 1
+                counts[(alen > rlen) - (alen < rlen) + 1] += 1
+
+    # Extract genes in one batched pass over the INFO fields
+    genes = set(map(extract_gene_from_info, infos))
+    genes.discard("")
 
-        # Extract gene
-        gene = extract_gene_from_info(info)
-        if gene:
-            genes.add(gene)
+    deletions, mnvs, insertions, snvs = counts
+    # MNV or complex — count as SNV-like
+    snvs += mnvs
 
     genes_sorted = sorted(genes)
 
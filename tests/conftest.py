@@ -6,18 +6,12 @@ reusable sample data following the CAR-T Intelligence Agent pattern.
 """
 
 import sys
-from pathlib import Path
-from unittest.mock import MagicMock
+from importlib import import_module
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-# ---------------------------------------------------------------------------
-# Ensure src is importable
-# ---------------------------------------------------------------------------
-_AGENT_ROOT = Path(__file__).resolve().parents[1]
-if str(_AGENT_ROOT) not in sys.path:
-    sys.path.insert(0, str(_AGENT_ROOT))
-
 from src.models import CrossCollectionResult, SearchHit
 
 
@@ -39,71 +33,203 @@ ALL_COLLECTION_NAMES = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# Lightweight stubs
+# ---------------------------------------------------------------------------
+# The shared dependency doubles below are plain objects rather than
+# MagicMock trees: MagicMock builds child mocks on every attribute access,
+# which dominates fixture cost across the suite.  Tests that need call
+# recording should create their own MagicMock locally.
+
+
+class _StubMethod:
+    """Callable stub returning a fixed, reassignable ``return_value``."""
+
+    __slots__ = ("return_value",)
+
+    def __init__(self, return_value):
+        self.return_value = return_value
+
+    def __call__(self, *args, **kwargs):
+        return self.return_value
+
+
+_ZERO_VECTOR = [0.0] * 384
+
+
+def _zero_vector(*args, **kwargs):
+    return _ZERO_VECTOR
+
+
+def _collection_stats(name, **kwargs):
+    return {
+        "name": name,
+        "num_entities": 42,
+        "fields": ["id", "embedding", "text_chunk"],
+    }
+
+
+def _build_mock_settings():
+    """Fallback settings object with the expected attributes."""
+    s = MagicMock()
+    s.MILVUS_HOST = "localhost"
+    s.MILVUS_PORT = 19530
+    s.EMBEDDING_DIM = 384
+    s.TOP_K = 5
+    s.SCORE_THRESHOLD = 0.4
+    s.LLM_PROVIDER = "anthropic"
+    s.LLM_MODEL = "claude-sonnet-4-20250514"
+    s.COLLECTION_LITERATURE = "onco_literature"
+    s.COLLECTION_TRIALS = "onco_trials"
+    s.COLLECTION_VARIANTS = "onco_variants"
+    s.COLLECTION_BIOMARKERS = "onco_biomarkers"
+    s.COLLECTION_THERAPIES = "onco_therapies"
+    s.COLLECTION_PATHWAYS = "onco_pathways"
+    s.COLLECTION_GUIDELINES = "onco_guidelines"
+    s.COLLECTION_RESISTANCE = "onco_resistance"
+    s.COLLECTION_OUTCOMES = "onco_outcomes"
+    s.COLLECTION_CASES = "onco_cases"
+    s.COLLECTION_GENOMIC = "genomic_evidence"
+    s.WEIGHT_VARIANTS = 0.18
+    s.WEIGHT_LITERATURE = 0.16
+    s.WEIGHT_THERAPIES = 0.14
+    s.WEIGHT_GUIDELINES = 0.12
+    s.WEIGHT_TRIALS = 0.10
+    s.WEIGHT_BIOMARKERS = 0.08
+    s.WEIGHT_RESISTANCE = 0.07
+    s.WEIGHT_PATHWAYS = 0.06
+    s.WEIGHT_OUTCOMES = 0.04
+    s.WEIGHT_CASES = 0.02
+    s.WEIGHT_GENOMIC = 0.03
+    return s
+
+
+_MOCK_SETTINGS = _build_mock_settings()
+
+
+# ---------------------------------------------------------------------------
+# src.rag_engine, imported against stub settings
+# ---------------------------------------------------------------------------
+# rag_engine reads settings.WEIGHT_* at import, and the real config.settings
+# resolves paths from the deployment layout.  Import it once here with
+# config.settings swapped for _MOCK_SETTINGS; patch.dict then drops the
+# stubs and src.rag_engine from sys.modules again, so test_rag_engine uses
+# this reference instead of a plain import.
+_stub_settings_module = SimpleNamespace(settings=_MOCK_SETTINGS)
+with patch.dict(sys.modules, {
+    "config": SimpleNamespace(settings=_stub_settings_module),
+    "config.settings": _stub_settings_module,
+}):
+    rag_engine_module = import_module("src.rag_engine")
+
+
+# ---------------------------------------------------------------------------
+# Case manager sample data
+# ---------------------------------------------------------------------------
+# Canonical sample data, frozen so no test can leak mutations into another.
+_SAMPLE_VARIANTS = tuple(MappingProxyType(v) for v in (
+    {"gene": "EGFR", "variant": "L858R", "chrom": "chr7", "pos": 55259515,
+     "ref": "T", "alt": "G", "consequence": "missense_variant", "filter": "PASS"},
+    {"gene": "TP53", "variant": "R175H", "chrom": "chr17", "pos": 7578406,
+     "ref": "C", "alt": "T", "consequence": "missense_variant", "filter": "PASS"},
+    {"gene": "BRAF", "variant": "V600E", "chrom": "chr7", "pos": 140453136,
+     "ref": "A", "alt": "T", "consequence": "missense_variant", "filter": "PASS"},
+    {"gene": "UNKNOWNGENE", "variant": "X123Y", "chrom": "chr1", "pos": 100,
+     "ref": "A", "alt": "G", "consequence": "missense_variant", "filter": "PASS"},
+))
+
+_SAMPLE_BIOMARKERS = MappingProxyType({
+    "MSI": "MSI-H",
+    "TMB": 14.2,
+    "PD-L1_TPS": 80,
+})
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Fixtures
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_embedder():
-    """Mock embedding model that returns 384-dimensional zero vectors."""
-    embedder = MagicMock()
-    embedder.embed_text.return_value = [0.0] * 384
-    embedder.encode.return_value = [0.0] * 384
-    embedder.embed.return_value = [0.0] * 384
-    return embedder
+    """Stub embedding model that returns 384-dimensional zero vectors."""
+    return SimpleNamespace(
+        embed_text=_zero_vector,
+        encode=_zero_vector,
+        embed=_zero_vector,
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_llm_client():
-    """Mock LLM client that returns a fixed response string."""
-    client = MagicMock()
-    client.chat.return_value = "Mock response"
-    client.chat_stream.return_value = iter(["Mock ", "response"])
-    return client
+    """Stub LLM client that returns a fixed response string."""
+    return SimpleNamespace(
+        chat=lambda *args, **kwargs: "Mock response",
+        chat_stream=lambda *args, **kwargs: iter(["Mock ", "response"]),
+    )
+
+
+def _no_context(*args, **kwargs):
+    return ""
+
+
+@pytest.fixture(scope="session")
+def mock_knowledge():
+    """Stub knowledge store whose ``lookup_*`` methods find no context."""
+    return SimpleNamespace(
+        lookup_gene=_no_context,
+        lookup_therapy=_no_context,
+        lookup_resistance=_no_context,
+        lookup_pathway=_no_context,
+        lookup_biomarker=_no_context,
+    )
+
+
+def _stub_collection_manager():
+    return SimpleNamespace(
+        search=_StubMethod([]),
+        search_all=_StubMethod({name: [] for name in ALL_COLLECTION_NAMES}),
+        get_collection_stats=_collection_stats,
+        query=_StubMethod([]),
+        insert=_StubMethod(0),
+        insert_batch=_StubMethod(0),
+        list_collections=_StubMethod(list(ALL_COLLECTION_NAMES)),
+    )
 
 
 @pytest.fixture
 def mock_collection_manager():
-    """Mock Milvus collection manager with all 11 collection names.
+    """Stub Milvus collection manager with all 11 collection names.
 
     - search() returns an empty list
     - search_all() returns a dict mapping each collection to an empty list
     - get_collection_stats() returns 42 entities for each collection
     - query() returns an empty list
     - insert() / insert_batch() returns 0
-    """
-    manager = MagicMock()
-
-    # search returns empty list
-    manager.search.return_value = []
+    - list_collections() returns the 11 collection names
 
-    # search_all returns dict with empty lists per collection
-    manager.search_all.return_value = {name: [] for name in ALL_COLLECTION_NAMES}
-
-    # get_collection_stats returns 42 entities for each collection
-    def _stats(name, **kwargs):
-        return {
-            "name": name,
-            "num_entities": 42,
-            "fields": ["id", "embedding", "text_chunk"],
-        }
-
-    manager.get_collection_stats.side_effect = _stats
+    Each method's ``return_value`` can be reassigned per test, so this
+    fixture stays function-scoped.
+    """
+    return _stub_collection_manager()
 
-    # query returns empty list
-    manager.query.return_value = []
 
-    # insert / insert_batch returns 0
-    manager.insert.return_value = 0
-    manager.insert_batch.return_value = 0
+@pytest.fixture(scope="session")
+def static_collection_manager():
+    """Session-wide ``mock_collection_manager`` for broader-scoped fixtures.
 
-    return manager
+    Same empty-result stub, shared by every module; tests must not
+    reassign its return values.
+    """
+    return _stub_collection_manager()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_search_hits():
-    """Five SearchHit objects spanning different oncology collections."""
+    """Five SearchHit objects spanning different oncology collections.
+
+    Session-scoped: treat as read-only and ``copy.deepcopy`` before mutating.
+    """
     return [
         SearchHit(
             collection="onco_literature",
@@ -151,9 +277,9 @@ def sample_search_hits():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_evidence(sample_search_hits):
-    """CrossCollectionResult populated with sample oncology hits."""
+    """CrossCollectionResult populated with sample oncology hits (read-only)."""
     return CrossCollectionResult(
         query="BRAF V600E targeted therapy melanoma",
         hits=sample_search_hits,
@@ -162,11 +288,12 @@ def sample_evidence(sample_search_hits):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_settings():
     """Create an OncoSettings instance with test defaults.
 
     Uses environment override to avoid touching real config files.
+    Session-scoped; tests must not mutate the returned settings.
     """
     try:
         from config.settings import OncoSettings
@@ -180,35 +307,73 @@ def sample_settings():
             LLM_MODEL="claude-sonnet-4-20250514",
         )
     except Exception:
-        # Fallback: return a MagicMock with the expected attributes
-        s = MagicMock()
-        s.MILVUS_HOST = "localhost"
-        s.MILVUS_PORT = 19530
-        s.EMBEDDING_DIM = 384
-        s.TOP_K = 5
-        s.SCORE_THRESHOLD = 0.4
-        s.LLM_PROVIDER = "anthropic"
-        s.LLM_MODEL = "claude-sonnet-4-20250514"
-        s.COLLECTION_LITERATURE = "onco_literature"
-        s.COLLECTION_TRIALS = "onco_trials"
-        s.COLLECTION_VARIANTS = "onco_variants"
-        s.COLLECTION_BIOMARKERS = "onco_biomarkers"
-        s.COLLECTION_THERAPIES = "onco_therapies"
-        s.COLLECTION_PATHWAYS = "onco_pathways"
-        s.COLLECTION_GUIDELINES = "onco_guidelines"
-        s.COLLECTION_RESISTANCE = "onco_resistance"
-        s.COLLECTION_OUTCOMES = "onco_outcomes"
-        s.COLLECTION_CASES = "onco_cases"
-        s.COLLECTION_GENOMIC = "genomic_evidence"
-        s.WEIGHT_VARIANTS = 0.18
-        s.WEIGHT_LITERATURE = 0.16
-        s.WEIGHT_THERAPIES = 0.14
-        s.WEIGHT_GUIDELINES = 0.12
-        s.WEIGHT_TRIALS = 0.10
-        s.WEIGHT_BIOMARKERS = 0.08
-        s.WEIGHT_RESISTANCE = 0.07
-        s.WEIGHT_PATHWAYS = 0.06
-        s.WEIGHT_OUTCOMES = 0.04
-        s.WEIGHT_CASES = 0.02
-        s.WEIGHT_GENOMIC = 0.03
-        return s
+        # Fallback: the shared mock with the expected attributes
+        return _MOCK_SETTINGS
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Case Manager Fixtures
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@pytest.fixture(scope="session")
+def _case_manager_template(mock_embedder):
+    """Session-wide OncologyCaseManager built once with stub dependencies.
+
+    Carries a fixed empty-result collection manager; ``case_manager``
+    swaps in the function-scoped stub since tests may reconfigure its
+    return values.
+    """
+    # Imported here so sessions that never build a case manager (e.g. a
+    # single unrelated test file) skip loading it and the knowledge tables.
+    from src.case_manager import OncologyCaseManager
+    from src.knowledge import ACTIONABLE_TARGETS
+
+    mock_collections = SimpleNamespace(
+        insert=lambda **_: 0,
+        search=lambda **_: [],
+        query=lambda **_: [],
+    )
+    mock_knowledge = SimpleNamespace(actionable_targets=ACTIONABLE_TARGETS)
+    mock_rag = SimpleNamespace(retrieve=lambda query, top_k=5, **_: [])
+    manager = OncologyCaseManager(
+        collection_manager=mock_collections,
+        embedder=mock_embedder,
+        knowledge=mock_knowledge,
+        rag_engine=mock_rag,
+    )
+    return manager
+
+
+@pytest.fixture
+def sample_variants():
+    """Pre-parsed variant list for testing.
+
+    create_case() writes ``actionability`` into each variant dict, so every
+    test gets its own shallow copies of the frozen records.
+    """
+    return [dict(v) for v in _SAMPLE_VARIANTS]
+
+
+@pytest.fixture(scope="session")
+def sample_biomarkers():
+    """Sample biomarker data (read-only)."""
+    return _SAMPLE_BIOMARKERS
+
+
+@pytest.fixture(scope="session")
+def case_with_mtb_packet(_case_manager_template, sample_biomarkers):
+    """(case, packet) for the sample variants, built once per session.
+
+    Treat both objects as read-only; tests that need a mutable case should
+    call ``case_manager.create_case`` themselves.
+    """
+    case = _case_manager_template.create_case(
+        patient_id="PT-SESSION",
+        cancer_type="NSCLC",
+        stage="IV",
+        vcf_content_or_variants=[dict(v) for v in _SAMPLE_VARIANTS],
+        biomarkers=sample_biomarkers,
+        prior_therapies=["carboplatin"],
+    )
+    return case, _case_manager_template.generate_mtb_packet(case)
@@ -7,19 +7,15 @@ VCF parsing, and MTB packet generation.
 All external dependencies (Milvus, embeddings, RAG engine) are mocked.
 """
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock
+import copy
 
 import pytest
 
-_AGENT_ROOT = Path(__file__).resolve().parents[1]
-if str(_AGENT_ROOT) not in sys.path:
-    sys.path.insert(0, str(_AGENT_ROOT))
-
-from src.case_manager import OncologyCaseManager
 from src.knowledge import ACTIONABLE_TARGETS
 
+# Uppercased actionable gene symbols for O(1) case-insensitive membership
+_ACTIONABLE_UPPER = frozenset(map(str.upper, ACTIONABLE_TARGETS))
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Fixtures
@@ -27,42 +23,34 @@ from src.knowledge import ACTIONABLE_TARGETS
 
 
 @pytest.fixture
-def case_manager(mock_collection_manager, mock_embedder):
-    """Create an OncologyCaseManager with mocked dependencies."""
-    mock_knowledge = MagicMock()
-    mock_rag = MagicMock()
-    mock_rag.retrieve.return_value = []
-    return OncologyCaseManager(
-        collection_manager=mock_collection_manager,
-        embedder=mock_embedder,
-        knowledge=mock_knowledge,
-        rag_engine=mock_rag,
-    )
-
-
-@pytest.fixture
-def sample_variants():
-    """Pre-parsed variant list for testing."""
-    return [
-        {"gene": "EGFR", "variant": "L858R", "chrom": "chr7", "pos": 55259515,
-         "ref": "T", "alt": "G", "consequence": "missense_variant", "filter": "PASS"},
-        {"gene": "TP53", "variant": "R175H", "chrom": "chr17", "pos": 7578406,
-         "ref": "C", "alt": "T", "consequence": "missense_variant", "filter": "PASS"},
-        {"gene": "BRAF", "variant": "V600E", "chrom": "chr7", "pos": 140453136,
-         "ref": "A", "alt": "T", "consequence": "missense_variant", "filter": "PASS"},
-        {"gene": "UNKNOWNGENE", "variant": "X123Y", "chrom": "chr1", "pos": 100,
-         "ref": "A", "alt": "G", "consequence": "missense_variant", "filter": "PASS"},
-    ]
-
-
-@pytest.fixture
-def sample_biomarkers():
-    """Sample biomarker data."""
-    return {
-        "MSI": "MSI-H",
-        "TMB": 14.2,
-        "PD-L1_TPS": 80,
-    }
+def case_manager(_case_manager_template, mock_collection_manager):
+    """Per-test shallow copy of the template with a fresh collection manager."""
+    manager = copy.copy(_case_manager_template)
+    manager.collection_manager = mock_collection_manager
+    return manager
+
+
+@pytest.fixture(scope="class")
+def manager(_case_manager_template):
+    """Class-shared copy of the template for tests of stateless methods."""
+    return copy.copy(_case_manager_template)
+
+
+# VCF corpus for the parsing tests
+_SIMPLE_VCF = (
+    "##fileformat=VCFv4.2\n"
+    "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+    "chr7\t55259515\t.\tT\tG\t100\tPASS\tANN=T|EGFR|missense_variant|HIGH\n"
+)
+_LOWQUAL_VCF = (
+    "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+    "chr1\t100\t.\tA\tG\t50\tLowQual\tANN=A|TP53|missense_variant|HIGH\n"
+)
+_HEADER_ONLY_VCF = (
+    "##fileformat=VCFv4.2\n"
+    "##INFO=<ID=ANN,...>\n"
+    "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -73,31 +61,28 @@ def sample_biomarkers():
 class TestClassifyVariantActionability:
     """Test _classify_variant_actionability for known and unknown targets."""
 
-    @pytest.fixture
-    def manager(self, case_manager):
-        return case_manager
-
-    def test_egfr_is_actionable(self, manager):
-        """EGFR is a well-known actionable target."""
-        result = manager._classify_variant_actionability("EGFR", "L858R")
-        assert result != "VUS", "EGFR L858R should be actionable, not VUS"
-
-    def test_braf_is_actionable(self, manager):
-        """BRAF V600E is a well-known actionable target."""
-        result = manager._classify_variant_actionability("BRAF", "V600E")
-        assert result != "VUS", "BRAF V600E should be actionable, not VUS"
-
-    def test_alk_is_recognized(self, manager):
-        """ALK should be recognized as an actionable gene."""
-        # ALK is in ACTIONABLE_TARGETS but actionability depends on variant details
-        result = manager._classify_variant_actionability("ALK", "EML4-ALK fusion")
-        # Should at least not crash; may be VUS if variant lookup doesn't match
+    @pytest.mark.parametrize("gene,variant,expect_actionable", [
+        pytest.param("EGFR", "L858R", True, id="egfr"),
+        pytest.param("BRAF", "V600E", True, id="braf"),
+        # ALK is in ACTIONABLE_TARGETS but actionability depends on variant
+        # details; it may be VUS if the variant lookup doesn't match
+        pytest.param("ALK", "EML4-ALK fusion", None, id="alk"),
+        pytest.param("BRCA1", "185delAG", None, id="brca1"),
+        # HER2 is listed as ERBB2 or HER2 in ACTIONABLE_TARGETS
+        pytest.param("HER2", "amplification", None, id="her2"),
+        pytest.param("RET", "KIF5B-RET fusion", None, id="ret"),
+    ])
+    def test_gene_is_recognized(self, manager, gene, variant, expect_actionable):
+        """Well-known targets classify cleanly; hallmark variants are actionable."""
+        result = manager._classify_variant_actionability(gene, variant)
         assert isinstance(result, str)
+        if expect_actionable:
+            assert result != "VUS", f"{gene} {variant} should be actionable, not VUS"
 
     def test_kras_g12c_is_actionable(self, manager):
         """KRAS G12C should be recognized."""
         result = manager._classify_variant_actionability("KRAS", "G12C")
-        assert result != "VUS" or "KRAS" in ACTIONABLE_TARGETS
+        assert result != "VUS" or "KRAS" in _ACTIONABLE_UPPER
 
     def test_unknown_gene_is_vus(self, manager):
         """An unknown gene should return VUS."""
@@ -115,22 +100,6 @@ class TestClassifyVariantActionability:
         result_lower = manager._classify_variant_actionability("egfr", "L858R")
         assert result_upper == result_lower
 
-    def test_brca1_is_recognized(self, manager):
-        """BRCA1 should be recognized as an actionable target."""
-        result = manager._classify_variant_actionability("BRCA1", "185delAG")
-        assert isinstance(result, str)
-
-    def test_her2_is_recognized(self, manager):
-        """HER2/ERBB2 should be recognized."""
-        # HER2 is listed as ERBB2 or HER2 in ACTIONABLE_TARGETS
-        result = manager._classify_variant_actionability("HER2", "amplification")
-        assert isinstance(result, str)
-
-    def test_ret_is_recognized(self, manager):
-        """RET should be recognized as actionable."""
-        result = manager._classify_variant_actionability("RET", "KIF5B-RET fusion")
-        assert isinstance(result, str)
-
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Case Creation Tests
@@ -140,18 +109,11 @@ class TestClassifyVariantActionability:
 class TestCreateCase:
     """Test create_case with mock data."""
 
-    def test_create_case_with_variant_list(self, case_manager, sample_variants, sample_biomarkers):
+    def test_create_case_with_variant_list(self, case_with_mtb_packet):
         """Creating a case with pre-parsed variants should succeed."""
-        case = case_manager.create_case(
-            patient_id="PT-001",
-            cancer_type="NSCLC",
-            stage="IV",
-            vcf_content_or_variants=sample_variants,
-            biomarkers=sample_biomarkers,
-            prior_therapies=["carboplatin + pemetrexed"],
-        )
+        case, _ = case_with_mtb_packet
         assert case is not None
-        assert case.patient_id == "PT-001"
+        assert case.patient_id == "PT-SESSION"
         assert case.cancer_type == "NSCLC"
         assert case.stage == "IV"
         # Variants should have actionability assigned
@@ -169,25 +131,19 @@ class TestCreateCase:
         assert case is not None
         assert case.variants == []
 
-    def test_create_case_default_biomarkers(self, case_manager, sample_variants):
-        """Missing biomarkers should default to empty dict."""
+    @pytest.mark.parametrize("field,expected", [
+        pytest.param("biomarkers", {}, id="biomarkers"),
+        pytest.param("prior_therapies", [], id="prior_therapies"),
+    ])
+    def test_create_case_defaults(self, case_manager, sample_variants, field, expected):
+        """Missing biomarkers / prior therapies should default to empty."""
         case = case_manager.create_case(
             patient_id="PT-003",
             cancer_type="MELANOMA",
             stage="IIIC",
             vcf_content_or_variants=sample_variants,
         )
-        assert case.biomarkers == {}
-
-    def test_create_case_default_prior_therapies(self, case_manager, sample_variants):
-        """Missing prior therapies should default to empty list."""
-        case = case_manager.create_case(
-            patient_id="PT-004",
-            cancer_type="CRC",
-            stage="IV",
-            vcf_content_or_variants=sample_variants,
-        )
-        assert case.prior_therapies == []
+        assert getattr(case, field) == expected
 
     def test_create_case_invalid_input_raises(self, case_manager):
         """Passing invalid vcf_content_or_variants type should raise ValueError."""
@@ -224,18 +180,9 @@ class TestCreateCase:
 class TestParseVCF:
     """Test _parse_vcf_text extracts PASS variants correctly."""
 
-    @pytest.fixture
-    def manager(self, case_manager):
-        return case_manager
-
     def test_parse_simple_vcf(self, manager):
         """Should parse a simple VCF line with PASS filter."""
-        vcf_text = (
-            "##fileformat=VCFv4.2\n"
-            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
-            "chr7\t55259515\t.\tT\tG\t100\tPASS\tANN=T|EGFR|missense_variant|HIGH\n"
-        )
-        variants = manager._parse_vcf_text(vcf_text)
+        variants = manager._parse_vcf_text(_SIMPLE_VCF)
         assert len(variants) == 1
         assert variants[0]["chrom"] == "chr7"
         assert variants[0]["filter"] == "PASS"
@@ -243,21 +190,12 @@ class TestParseVCF:
 
     def test_skip_non_pass_variants(self, manager):
         """Should skip variants that do not have PASS filter."""
-        vcf_text = (
-            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
-            "chr1\t100\t.\tA\tG\t50\tLowQual\tANN=A|TP53|missense_variant|HIGH\n"
-        )
-        variants = manager._parse_vcf_text(vcf_text)
+        variants = manager._parse_vcf_text(_LOWQUAL_VCF)
         assert len(variants) == 0
 
     def test_skip_header_lines(self, manager):
         """Should skip all header lines starting with #."""
-        vcf_text = (
-            "##fileformat=VCFv4.2\n"
-            "##INFO=<ID=ANN,...>\n"
-            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
-        )
-        variants = manager._parse_vcf_text(vcf_text)
+        variants = manager._parse_vcf_text(_HEADER_ONLY_VCF)
         assert len(variants) == 0
 
     def test_parse_empty_vcf(self, manager):
@@ -274,17 +212,9 @@ class TestParseVCF:
 class TestGenerateMTBPacket:
     """Test generate_mtb_packet structure has required sections."""
 
-    def test_packet_structure(self, case_manager, sample_variants, sample_biomarkers):
+    def test_packet_structure(self, case_with_mtb_packet):
         """MTB packet should contain all required sections."""
-        case = case_manager.create_case(
-            patient_id="PT-MTB-001",
-            cancer_type="NSCLC",
-            stage="IV",
-            vcf_content_or_variants=sample_variants,
-            biomarkers=sample_biomarkers,
-            prior_therapies=["carboplatin"],
-        )
-        packet = case_manager.generate_mtb_packet(case)
+        case, packet = case_with_mtb_packet
 
         assert packet is not None
         assert packet.case_id == case.case_id
@@ -294,29 +224,16 @@ class TestGenerateMTBPacket:
         assert isinstance(packet.trial_matches, list)
         assert isinstance(packet.open_questions, list)
 
-    def test_packet_variant_table_populated(self, case_manager, sample_variants):
+    def test_packet_variant_table_populated(self, case_with_mtb_packet, sample_variants):
         """Variant table should have entries for each variant."""
-        case = case_manager.create_case(
-            patient_id="PT-MTB-002",
-            cancer_type="NSCLC",
-            stage="IV",
-            vcf_content_or_variants=sample_variants,
-        )
-        packet = case_manager.generate_mtb_packet(case)
+        _, packet = case_with_mtb_packet
         assert len(packet.variant_table) == len(sample_variants)
 
-    def test_packet_open_questions_for_vus(self, case_manager, sample_variants):
+    def test_packet_open_questions_for_vus(self, case_with_mtb_packet):
         """Open questions should flag VUS variants."""
-        case = case_manager.create_case(
-            patient_id="PT-MTB-003",
-            cancer_type="NSCLC",
-            stage="IV",
-            vcf_content_or_variants=sample_variants,
-        )
-        packet = case_manager.generate_mtb_packet(case)
+        _, packet = case_with_mtb_packet
         # At least UNKNOWNGENE should be flagged as VUS
-        vus_questions = [q for q in packet.open_questions if "uncertain significance" in q.lower()]
-        assert len(vus_questions) >= 1
+        assert any("uncertain significance" in q.lower() for q in packet.open_questions)
 
     def test_packet_open_questions_for_missing_biomarkers(self, case_manager, sample_variants):
         """Open questions should flag missing biomarkers (MSI, TMB, PD-L1)."""
@@ -328,5 +245,4 @@ class TestGenerateMTBPacket:
             biomarkers={},  # no biomarkers
         )
         packet = case_manager.generate_mtb_packet(case)
-        missing_questions = [q for q in packet.open_questions if "missing" in q.lower()]
-        assert len(missing_questions) >= 1
+        assert any("missing" in q.lower() for q in packet.open_questions)
@@ -7,16 +7,10 @@ definitions are correctly structured for all 11 Milvus collections.
 All Milvus client calls are mocked -- no live connection required.
 """
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 
-_AGENT_ROOT = Path(__file__).resolve().parents[1]
-if str(_AGENT_ROOT) not in sys.path:
-    sys.path.insert(0, str(_AGENT_ROOT))
-
 from src.collections import (
     COLLECTION_MODELS,
     COLLECTION_SCHEMAS,
@@ -123,50 +117,63 @@ class TestCollectionModels:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+ALL_FIELD_LISTS = {
+    "onco_literature": ONCO_LITERATURE_FIELDS,
+    "onco_trials": ONCO_TRIALS_FIELDS,
+    "onco_variants": ONCO_VARIANTS_FIELDS,
+    "onco_biomarkers": ONCO_BIOMARKERS_FIELDS,
+    "onco_therapies": ONCO_THERAPIES_FIELDS,
+    "onco_pathways": ONCO_PATHWAYS_FIELDS,
+    "onco_guidelines": ONCO_GUIDELINES_FIELDS,
+    "onco_resistance": ONCO_RESISTANCE_FIELDS,
+    "onco_outcomes": ONCO_OUTCOMES_FIELDS,
+    "onco_cases": ONCO_CASES_FIELDS,
+    "genomic_evidence": GENOMIC_EVIDENCE_FIELDS,
+}
+
+# Field-name sets and embedding dims, computed once for all schema tests
+FIELD_NAMES = {
+    name: frozenset(f.name for f in fields)
+    for name, fields in ALL_FIELD_LISTS.items()
+}
+# Collections expected to carry a free-text content field
+TEXT_COLLECTIONS = (
+    "onco_literature", "onco_variants", "onco_biomarkers",
+    "onco_therapies", "onco_pathways", "onco_guidelines",
+    "onco_resistance", "onco_outcomes", "onco_cases",
+    "genomic_evidence",
+)
+EMB_DIMS = {
+    name: [f.dim for f in schema.fields if f.name == "embedding"]
+    for name, schema in COLLECTION_SCHEMAS.items()
+}
+
+
 class TestFieldSchemas:
     """Verify required fields are present in every collection schema."""
 
-    ALL_FIELD_LISTS = {
-        "onco_literature": ONCO_LITERATURE_FIELDS,
-        "onco_trials": ONCO_TRIALS_FIELDS,
-        "onco_variants": ONCO_VARIANTS_FIELDS,
-        "onco_biomarkers": ONCO_BIOMARKERS_FIELDS,
-        "onco_therapies": ONCO_THERAPIES_FIELDS,
-        "onco_pathways": ONCO_PATHWAYS_FIELDS,
-        "onco_guidelines": ONCO_GUIDELINES_FIELDS,
-        "onco_resistance": ONCO_RESISTANCE_FIELDS,
-        "onco_outcomes": ONCO_OUTCOMES_FIELDS,
-        "onco_cases": ONCO_CASES_FIELDS,
-        "genomic_evidence": GENOMIC_EVIDENCE_FIELDS,
-    }
-
-    @pytest.mark.parametrize("collection_name", ALL_FIELD_LISTS.keys())
-    def test_has_id_field(self, collection_name):
+    @pytest.mark.parametrize(
+        "collection_name,field_names", FIELD_NAMES.items(), ids=list(FIELD_NAMES)
+    )
+    def test_has_id_field(self, collection_name, field_names):
         """Every collection must have an 'id' primary key field."""
-        fields = self.ALL_FIELD_LISTS[collection_name]
-        field_names = [f.name for f in fields]
         assert "id" in field_names, f"{collection_name} missing 'id' field"
 
-    @pytest.mark.parametrize("collection_name", ALL_FIELD_LISTS.keys())
-    def test_has_embedding_field(self, collection_name):
+    @pytest.mark.parametrize(
+        "collection_name,field_names", FIELD_NAMES.items(), ids=list(FIELD_NAMES)
+    )
+    def test_has_embedding_field(self, collection_name, field_names):
         """Every collection must have an 'embedding' vector field."""
-        fields = self.ALL_FIELD_LISTS[collection_name]
-        field_names = [f.name for f in fields]
         assert "embedding" in field_names, f"{collection_name} missing 'embedding' field"
 
-    @pytest.mark.parametrize("collection_name", [
-        "onco_literature", "onco_variants", "onco_biomarkers",
-        "onco_therapies", "onco_pathways", "onco_guidelines",
-        "onco_resistance", "onco_outcomes", "onco_cases",
-        "genomic_evidence",
-    ])
-    def test_has_text_or_summary_field(self, collection_name):
+    @pytest.mark.parametrize(
+        "collection_name,field_names",
+        [(name, FIELD_NAMES[name]) for name in TEXT_COLLECTIONS],
+        ids=TEXT_COLLECTIONS,
+    )
+    def test_has_text_or_summary_field(self, collection_name, field_names):
         """Most collections should have a text_chunk or text_summary field."""
-        fields = self.ALL_FIELD_LISTS[collection_name]
-        field_names = [f.name for f in fields]
-        has_text = any(
-            fn in field_names for fn in ("text_chunk", "text_summary", "text")
-        )
+        has_text = not field_names.isdisjoint(("text_chunk", "text_summary", "text"))
         assert has_text, f"{collection_name} missing text content field"
 
 
@@ -177,15 +184,9 @@ class TestEmbeddingDimension:
         """EMBEDDING_DIM constant should be 384."""
         assert EMBEDDING_DIM == 384
 
-    @pytest.mark.parametrize("collection_name", COLLECTION_SCHEMAS.keys())
-    def test_embedding_dim_in_schema(self, collection_name):
-        """Each collection's embedding field should have dim=384."""
-        schema = COLLECTION_SCHEMAS[collection_name]
-        embedding_fields = [f for f in schema.fields if f.name == "embedding"]
-        assert len(embedding_fields) == 1, f"{collection_name} should have exactly one embedding field"
-        assert embedding_fields[0].dim == 384, (
-            f"{collection_name} embedding dim should be 384, got {embedding_fields[0].dim}"
-        )
+    def test_embedding_dim_in_schemas(self):
+        """Every collection should have exactly one embedding field with dim=384."""
+        assert EMB_DIMS == {name: [384] for name in COLLECTION_SCHEMAS}
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -193,33 +194,35 @@ class TestEmbeddingDimension:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.fixture(scope="module")
+def onco_settings():
+    """Default OncoSettings, skipping when config.settings is unavailable."""
+    settings_mod = pytest.importorskip("config.settings")
+    return settings_mod.OncoSettings()
+
+
 class TestCollectionNamesMatchSettings:
     """Verify collection names match the defaults in OncoSettings."""
 
-    def test_settings_collection_names(self):
+    @pytest.mark.parametrize("attr_name,expected", [
+        ("COLLECTION_LITERATURE", "onco_literature"),
+        ("COLLECTION_TRIALS", "onco_trials"),
+        ("COLLECTION_VARIANTS", "onco_variants"),
+        ("COLLECTION_BIOMARKERS", "onco_biomarkers"),
+        ("COLLECTION_THERAPIES", "onco_therapies"),
+        ("COLLECTION_PATHWAYS", "onco_pathways"),
+        ("COLLECTION_GUIDELINES", "onco_guidelines"),
+        ("COLLECTION_RESISTANCE", "onco_resistance"),
+        ("COLLECTION_OUTCOMES", "onco_outcomes"),
+        ("COLLECTION_CASES", "onco_cases"),
+        ("COLLECTION_GENOMIC", "genomic_evidence"),
+    ])
+    def test_settings_collection_names(self, onco_settings, attr_name, expected):
         """OncoSettings default collection names should match COLLECTION_SCHEMAS keys."""
-        try:
-            from config.settings import OncoSettings
-            s = OncoSettings()
-            expected_mapping = {
-                s.COLLECTION_LITERATURE: "onco_literature",
-                s.COLLECTION_TRIALS: "onco_trials",
-                s.COLLECTION_VARIANTS: "onco_variants",
-                s.COLLECTION_BIOMARKERS: "onco_biomarkers",
-                s.COLLECTION_THERAPIES: "onco_therapies",
-                s.COLLECTION_PATHWAYS: "onco_pathways",
-                s.COLLECTION_GUIDELINES: "onco_guidelines",
-                s.COLLECTION_RESISTANCE: "onco_resistance",
-                s.COLLECTION_OUTCOMES: "onco_outcomes",
-                s.COLLECTION_CASES: "onco_cases",
-                s.COLLECTION_GENOMIC: "genomic_evidence",
-            }
-            for setting_val, expected in expected_mapping.items():
-                assert setting_val == expected, (
-                    f"Settings value '{setting_val}' does not match expected '{expected}'"
-                )
-        except ImportError:
-            pytest.skip("config.settings not importable in test environment")
+        setting_val = getattr(onco_settings, attr_name)
+        assert setting_val == expected, (
+            f"Settings value '{setting_val}' does not match expected '{expected}'"
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -230,43 +233,55 @@ class TestCollectionNamesMatchSettings:
 class TestOncoCollectionManagerInit:
     """Test OncoCollectionManager initialization."""
 
-    def test_default_init(self):
-        manager = OncoCollectionManager()
-        assert manager.host == "localhost"
-        assert manager.port == 19530
-        assert manager.alias == "default"
+    @pytest.mark.parametrize("kwargs,expected", [
+        pytest.param({}, ("localhost", 19530, "default"), id="default"),
+        pytest.param(
+            {"host": "milvus-server", "port": 19531, "alias": "test"},
+            ("milvus-server", 19531, "test"),
+            id="custom",
+        ),
+    ])
+    def test_init(self, kwargs, expected):
+        manager = OncoCollectionManager(**kwargs)
+        assert (manager.host, manager.port, manager.alias) == expected
+        assert manager._collections == {}
 
-    def test_custom_init(self):
-        manager = OncoCollectionManager(host="milvus-server", port=19531, alias="test")
-        assert manager.host == "milvus-server"
-        assert manager.port == 19531
-        assert manager.alias == "test"
 
-    def test_internal_collections_empty(self):
-        manager = OncoCollectionManager()
-        assert manager._collections == {}
+@pytest.fixture(scope="module")
+def _milvus_patch():
+    """Patch the pymilvus entry points used by src.collections once per module."""
+    with patch.multiple(
+        "src.collections",
+        utility=DEFAULT,
+        Collection=DEFAULT,
+        connections=DEFAULT,
+    ) as mocks:
+        yield mocks
+
+
+@pytest.fixture
+def milvus_mocks(_milvus_patch):
+    """The shared Milvus mocks, reset so no configuration leaks between tests."""
+    for mock in _milvus_patch.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _milvus_patch
 
 
+@pytest.mark.usefixtures("milvus_mocks")
 class TestOncoCollectionManagerCreateCollection:
     """Test create_collection with mocked Milvus."""
 
-    @patch("src.collections.utility")
-    @patch("src.collections.Collection")
-    @patch("src.collections.connections")
-    def test_create_unknown_collection_raises(self, mock_conn, mock_col, mock_util):
+    def test_create_unknown_collection_raises(self):
         """Creating an unknown collection should raise ValueError."""
         manager = OncoCollectionManager()
         with pytest.raises(ValueError, match="Unknown collection"):
             manager.create_collection("nonexistent_collection")
 
-    @patch("src.collections.utility")
-    @patch("src.collections.Collection")
-    @patch("src.collections.connections")
-    def test_create_new_collection(self, mock_conn, mock_col_cls, mock_util):
+    def test_create_new_collection(self, milvus_mocks):
         """Creating a valid new collection should succeed."""
-        mock_util.has_collection.return_value = False
+        milvus_mocks["utility"].has_collection.return_value = False
         mock_col_instance = MagicMock()
-        mock_col_cls.return_value = mock_col_instance
+        milvus_mocks["Collection"].return_value = mock_col_instance
 
         manager = OncoCollectionManager()
         col = manager.create_collection("onco_literature")
@@ -6,15 +6,10 @@ PATHWAY_MAP, BIOMARKER_PANELS, ENTITY_ALIASES, and all
 helper functions.
 """
 
-import sys
-from pathlib import Path
+import re
 
 import pytest
 
-_AGENT_ROOT = Path(__file__).resolve().parents[1]
-if str(_AGENT_ROOT) not in sys.path:
-    sys.path.insert(0, str(_AGENT_ROOT))
-
 from src.knowledge import (
     ACTIONABLE_TARGETS,
     BIOMARKER_PANELS,
@@ -30,57 +25,105 @@ from src.knowledge import (
     resolve_comparison_entity,
 )
 
+# Representative entries whose required fields are checked, per table
+_REQUIRED_FIELD_GENES = ("BRAF", "EGFR", "ALK", "KRAS")
+_REQUIRED_FIELD_DRUGS = ("osimertinib", "pembrolizumab", "dabrafenib")
+_REQUIRED_FIELD_PATHWAYS = ("MAPK", "PI3K_AKT_mTOR", "DDR")
+_REQUIRED_FIELD_BIOMARKERS = ("TMB-H", "MSI-H", "PD-L1")
+
+# Either-or expectations on helper context strings, one compiled search each
+_EGFR_CONTEXT_RE = re.compile(r"osimertinib|Epidermal")
+_CANCER_TYPES_RE = re.compile(r"Cancer types:|melanoma")
+_TARGETED_THERAPIES_RE = re.compile(r"Targeted therapies:|vemurafenib")
+_THERAPY_TARGETS_RE = re.compile(r"Targets:|EGFR")
+_RESISTANCE_MUTATION_RE = re.compile(r"(?i:mutation)|C797S")
+_KEY_GENES_RE = re.compile(r"Key genes:|KRAS")
+_TMB_RE = re.compile(r"TMB|Tumor Mutational")
+_MSI_RE = re.compile(r"MSI|Microsatellite")
+_TESTING_METHOD_RE = re.compile(r"Testing:|NGS")
+_CUTOFF_RE = re.compile(r"Cutoff:|10")
+
+# Keys every entry of each knowledge table must carry
+_TARGET_REQUIRED = frozenset({
+    "gene", "full_name", "cancer_types", "key_variants",
+    "targeted_therapies", "pathway", "evidence_level", "description",
+})
+_THERAPY_REQUIRED = frozenset({
+    "drug_name", "brand_name", "category", "targets",
+    "approved_indications", "mechanism", "key_trials", "evidence_level",
+})
+_PATHWAY_REQUIRED = frozenset({
+    "pathway_name", "key_genes", "therapeutic_targets", "cross_talk",
+    "clinical_relevance",
+})
+_BIOMARKER_REQUIRED = frozenset({
+    "name", "type", "testing_method", "clinical_cutoff", "evidence_level",
+    "description",
+})
+_RESISTANCE_REQUIRED = frozenset({"mutation", "gene", "frequency"})
+
+TABLES = {
+    "ACTIONABLE_TARGETS": ACTIONABLE_TARGETS,
+    "THERAPY_MAP": THERAPY_MAP,
+    "PATHWAY_MAP": PATHWAY_MAP,
+    "BIOMARKER_PANELS": BIOMARKER_PANELS,
+}
+
+# List-valued fields indexed as frozensets for O(1) membership checks
+_INDEXED_FIELDS = (
+    "cancer_types", "targeted_therapies", "resistance_mutations",
+    "key_genes", "therapeutic_targets", "targets",
+)
+
+
+def _build_indices():
+    """Frozenset view of every indexed field, keyed by (table, key, field)."""
+    return {
+        (table_name, key, field): frozenset(entry[field])
+        for table_name, table in TABLES.items()
+        for key, entry in table.items()
+        for field in _INDEXED_FIELDS
+        if field in entry
+    }
+
+
+_FIELD_SETS = _build_indices()
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # ACTIONABLE_TARGETS Tests
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.mark.data_integrity
 class TestActionableTargets:
     """Test ACTIONABLE_TARGETS has expected genes."""
 
-    @pytest.mark.parametrize("gene", [
+    EXPECTED_GENES = frozenset({
         "BRAF", "EGFR", "ALK", "ROS1", "KRAS", "HER2",
         "NTRK", "RET", "MET", "FGFR", "PIK3CA", "IDH1",
         "IDH2", "BRCA1", "BRCA2", "TP53", "PTEN", "CDKN2A",
         "STK11", "ESR1",
-    ])
-    def test_gene_present(self, gene):
-        assert gene in ACTIONABLE_TARGETS, f"Missing gene: {gene}"
+    })
+
+    def test_expected_genes_present(self):
+        missing = self.EXPECTED_GENES - ACTIONABLE_TARGETS.keys()
+        assert not missing, f"Missing genes: {sorted(missing)}"
 
     def test_minimum_gene_count(self):
         """Should have at least 20 actionable targets."""
         assert len(ACTIONABLE_TARGETS) >= 20
 
-    @pytest.mark.parametrize("gene", ["BRAF", "EGFR", "ALK", "KRAS"])
+    @pytest.mark.parametrize("gene", _REQUIRED_FIELD_GENES)
     def test_gene_has_required_fields(self, gene):
         """Each gene entry should have required fields."""
-        target = ACTIONABLE_TARGETS[gene]
-        assert "gene" in target
-        assert "full_name" in target
-        assert "cancer_types" in target
-        assert "key_variants" in target
-        assert "targeted_therapies" in target
-        assert "pathway" in target
-        assert "evidence_level" in target
-        assert "description" in target
-
-    def test_braf_cancer_types(self):
-        """BRAF should include melanoma in cancer types."""
-        assert "melanoma" in ACTIONABLE_TARGETS["BRAF"]["cancer_types"]
-
-    def test_egfr_cancer_types(self):
-        """EGFR should include NSCLC in cancer types."""
-        assert "NSCLC" in ACTIONABLE_TARGETS["EGFR"]["cancer_types"]
+        missing = _TARGET_REQUIRED - ACTIONABLE_TARGETS[gene].keys()
+        assert not missing, f"{gene} missing {sorted(missing)}"
 
     def test_braf_has_therapies(self):
         """BRAF should have targeted therapies."""
         assert len(ACTIONABLE_TARGETS["BRAF"]["targeted_therapies"]) >= 1
 
-    def test_egfr_has_osimertinib(self):
-        """EGFR should include osimertinib in targeted therapies."""
-        assert "osimertinib" in ACTIONABLE_TARGETS["EGFR"]["targeted_therapies"]
-
     def test_braf_evidence_level_a(self):
         """BRAF should have evidence level A."""
         assert ACTIONABLE_TARGETS["BRAF"]["evidence_level"] == "A"
@@ -95,8 +138,9 @@ class TestActionableTargets:
 
     def test_msi_h_is_tissue_agnostic(self):
         """MSI_H should include tissue-agnostic in cancer types."""
-        if "MSI_H" in ACTIONABLE_TARGETS:
-            assert "tissue-agnostic" in ACTIONABLE_TARGETS["MSI_H"]["cancer_types"]
+        key = ("ACTIONABLE_TARGETS", "MSI_H", "cancer_types")
+        if key in _FIELD_SETS:
+            assert "tissue-agnostic" in _FIELD_SETS[key]
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -104,38 +148,30 @@ class TestActionableTargets:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.mark.data_integrity
 class TestTherapyMap:
     """Test THERAPY_MAP has expected drugs."""
 
-    @pytest.mark.parametrize("drug", [
+    EXPECTED_DRUGS = frozenset({
         "osimertinib", "pembrolizumab", "nivolumab", "vemurafenib",
         "dabrafenib", "sotorasib", "adagrasib", "larotrectinib",
         "entrectinib", "selpercatinib", "capmatinib", "olaparib",
         "alpelisib", "ivosidenib",
-    ])
-    def test_drug_present(self, drug):
-        assert drug in THERAPY_MAP, f"Missing drug: {drug}"
+    })
+
+    def test_expected_drugs_present(self):
+        missing = self.EXPECTED_DRUGS - THERAPY_MAP.keys()
+        assert not missing, f"Missing drugs: {sorted(missing)}"
 
     def test_minimum_drug_count(self):
         """Should have at least 15 drugs."""
         assert len(THERAPY_MAP) >= 15
 
-    @pytest.mark.parametrize("drug", ["osimertinib", "pembrolizumab", "dabrafenib"])
+    @pytest.mark.parametrize("drug", _REQUIRED_FIELD_DRUGS)
     def test_drug_has_required_fields(self, drug):
         """Each drug entry should have required fields."""
-        therapy = THERAPY_MAP[drug]
-        assert "drug_name" in therapy
-        assert "brand_name" in therapy
-        assert "category" in therapy
-        assert "targets" in therapy
-        assert "approved_indications" in therapy
-        assert "mechanism" in therapy
-        assert "key_trials" in therapy
-        assert "evidence_level" in therapy
-
-    def test_osimertinib_targets_egfr(self):
-        """Osimertinib should target EGFR."""
-        assert "EGFR" in THERAPY_MAP["osimertinib"]["targets"]
+        missing = _THERAPY_REQUIRED - THERAPY_MAP[drug].keys()
+        assert not missing, f"{drug} missing {sorted(missing)}"
 
     def test_osimertinib_brand_is_tagrisso(self):
         """Osimertinib brand name should be Tagrisso."""
@@ -145,29 +181,28 @@ class TestTherapyMap:
         """Pembrolizumab should be categorized as immunotherapy."""
         assert THERAPY_MAP["pembrolizumab"]["category"] == "immunotherapy"
 
-    def test_pembrolizumab_targets_pd1(self):
-        """Pembrolizumab should target PD-1."""
-        assert "PD-1" in THERAPY_MAP["pembrolizumab"]["targets"]
-
 
 # ═══════════════════════════════════════════════════════════════════════════
 # RESISTANCE_MAP Tests
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.mark.data_integrity
 class TestResistanceMap:
     """Test RESISTANCE_MAP has expected mechanisms."""
 
-    @pytest.mark.parametrize("drug_class", [
+    EXPECTED_DRUG_CLASSES = frozenset({
         "osimertinib",
         "BRAF V600 inhibitors",
         "ALK TKIs",
         "KRAS G12C inhibitors",
         "PARP inhibitors",
         "anti-PD-1/PD-L1",
-    ])
-    def test_drug_class_present(self, drug_class):
-        assert drug_class in RESISTANCE_MAP, f"Missing drug class: {drug_class}"
+    })
+
+    def test_expected_drug_classes_present(self):
+        missing = self.EXPECTED_DRUG_CLASSES - RESISTANCE_MAP.keys()
+        assert not missing, f"Missing drug classes: {sorted(missing)}"
 
     def test_minimum_entry_count(self):
         """Should have at least 5 resistance entries."""
@@ -175,23 +210,22 @@ class TestResistanceMap:
 
     def test_osimertinib_has_c797s(self):
         """Osimertinib resistance should include C797S."""
-        mechanisms = RESISTANCE_MAP["osimertinib"]
-        mutations = [m["mutation"] for m in mechanisms]
-        assert "C797S" in mutations
+        assert "C797S" in {m["mutation"] for m in RESISTANCE_MAP["osimertinib"]}
 
     def test_each_entry_has_required_fields(self):
         """Each resistance mechanism entry should have required fields."""
-        for drug_class, mechanisms in RESISTANCE_MAP.items():
-            for m in mechanisms:
-                assert "mutation" in m, f"{drug_class} entry missing 'mutation'"
-                assert "gene" in m, f"{drug_class} entry missing 'gene'"
-                assert "frequency" in m, f"{drug_class} entry missing 'frequency'"
+        bad = [
+            (drug_class, i)
+            for drug_class, mechanisms in RESISTANCE_MAP.items()
+            for i, m in enumerate(mechanisms)
+            if not _RESISTANCE_REQUIRED.issubset(m)
+        ]
+        assert not bad, f"Entries missing {sorted(_RESISTANCE_REQUIRED)}: {bad}"
 
     def test_parp_inhibitor_reversion(self):
         """PARP inhibitor resistance should include reversion mutations."""
-        mechanisms = RESISTANCE_MAP["PARP inhibitors"]
-        mutations = [m["mutation"] for m in mechanisms]
-        assert any("reversion" in m.lower() for m in mutations)
+        mutations = " ".join(m["mutation"] for m in RESISTANCE_MAP["PARP inhibitors"])
+        assert "reversion" in mutations.lower()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -199,46 +233,29 @@ class TestResistanceMap:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.mark.data_integrity
 class TestPathwayMap:
     """Test PATHWAY_MAP has expected pathways."""
 
-    @pytest.mark.parametrize("pathway", [
+    EXPECTED_PATHWAYS = frozenset({
         "MAPK", "PI3K_AKT_mTOR", "DDR", "cell_cycle",
         "WNT", "JAK_STAT", "apoptosis", "angiogenesis",
         "Notch", "Hedgehog",
-    ])
-    def test_pathway_present(self, pathway):
-        assert pathway in PATHWAY_MAP, f"Missing pathway: {pathway}"
+    })
+
+    def test_expected_pathways_present(self):
+        missing = self.EXPECTED_PATHWAYS - PATHWAY_MAP.keys()
+        assert not missing, f"Missing pathways: {sorted(missing)}"
 
     def test_minimum_pathway_count(self):
         """Should have at least 8 pathways."""
         assert len(PATHWAY_MAP) >= 8
 
-    @pytest.mark.parametrize("pathway", ["MAPK", "PI3K_AKT_mTOR", "DDR"])
+    @pytest.mark.parametrize("pathway", _REQUIRED_FIELD_PATHWAYS)
     def test_pathway_has_required_fields(self, pathway):
         """Each pathway should have required fields."""
-        pw = PATHWAY_MAP[pathway]
-        assert "pathway_name" in pw
-        assert "key_genes" in pw
-        assert "therapeutic_targets" in pw
-        assert "cross_talk" in pw
-        assert "clinical_relevance" in pw
-
-    def test_mapk_has_kras(self):
-        """MAPK pathway should include KRAS."""
-        assert "KRAS" in PATHWAY_MAP["MAPK"]["key_genes"]
-
-    def test_mapk_has_braf(self):
-        """MAPK pathway should include BRAF."""
-        assert "BRAF" in PATHWAY_MAP["MAPK"]["key_genes"]
-
-    def test_ddr_has_brca1(self):
-        """DDR pathway should include BRCA1."""
-        assert "BRCA1" in PATHWAY_MAP["DDR"]["key_genes"]
-
-    def test_pi3k_has_pik3ca(self):
-        """PI3K/AKT/mTOR pathway should include PIK3CA."""
-        assert "PIK3CA" in PATHWAY_MAP["PI3K_AKT_mTOR"]["key_genes"]
+        missing = _PATHWAY_REQUIRED - PATHWAY_MAP[pathway].keys()
+        assert not missing, f"{pathway} missing {sorted(missing)}"
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -246,31 +263,29 @@ class TestPathwayMap:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.mark.data_integrity
 class TestBiomarkerPanels:
     """Test BIOMARKER_PANELS has expected biomarkers."""
 
-    @pytest.mark.parametrize("biomarker", [
+    EXPECTED_BIOMARKERS = frozenset({
         "TMB-H", "MSI-H", "PD-L1", "HRD", "BRCA_status",
         "EGFR_mutation", "ALK_fusion", "BRAF_V600",
         "KRAS_G12C", "RET_fusion", "NTRK_fusion", "HER2_amp",
-    ])
-    def test_biomarker_present(self, biomarker):
-        assert biomarker in BIOMARKER_PANELS, f"Missing biomarker: {biomarker}"
+    })
+
+    def test_expected_biomarkers_present(self):
+        missing = self.EXPECTED_BIOMARKERS - BIOMARKER_PANELS.keys()
+        assert not missing, f"Missing biomarkers: {sorted(missing)}"
 
     def test_minimum_biomarker_count(self):
         """Should have at least 10 biomarker panels."""
         assert len(BIOMARKER_PANELS) >= 10
 
-    @pytest.mark.parametrize("biomarker", ["TMB-H", "MSI-H", "PD-L1"])
+    @pytest.mark.parametrize("biomarker", _REQUIRED_FIELD_BIOMARKERS)
     def test_biomarker_has_required_fields(self, biomarker):
         """Each biomarker should have required fields."""
-        bm = BIOMARKER_PANELS[biomarker]
-        assert "name" in bm
-        assert "type" in bm
-        assert "testing_method" in bm
-        assert "clinical_cutoff" in bm
-        assert "evidence_level" in bm
-        assert "description" in bm
+        missing = _BIOMARKER_REQUIRED - BIOMARKER_PANELS[biomarker].keys()
+        assert not missing, f"{biomarker} missing {sorted(missing)}"
 
     def test_tmb_is_predictive(self):
         """TMB-H should be a predictive biomarker."""
@@ -280,9 +295,39 @@ class TestBiomarkerPanels:
         """MSI-H should have evidence level A."""
         assert BIOMARKER_PANELS["MSI-H"]["evidence_level"] == "A"
 
-    def test_pdl1_has_nsclc(self):
-        """PD-L1 should include NSCLC in cancer types."""
-        assert "NSCLC" in BIOMARKER_PANELS["PD-L1"]["cancer_types"]
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Table Field Content Tests
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+# (table, key, list-valued field, values that field must contain)
+EXPECTED_FIELD_CONTENTS = (
+    ("ACTIONABLE_TARGETS", "BRAF", "cancer_types", {"melanoma"}),
+    ("ACTIONABLE_TARGETS", "EGFR", "cancer_types", {"NSCLC"}),
+    ("ACTIONABLE_TARGETS", "EGFR", "targeted_therapies", {"osimertinib"}),
+    ("THERAPY_MAP", "osimertinib", "targets", {"EGFR"}),
+    ("THERAPY_MAP", "pembrolizumab", "targets", {"PD-1"}),
+    ("PATHWAY_MAP", "MAPK", "key_genes", {"KRAS", "BRAF"}),
+    ("PATHWAY_MAP", "DDR", "key_genes", {"BRCA1"}),
+    ("PATHWAY_MAP", "PI3K_AKT_mTOR", "key_genes", {"PIK3CA"}),
+    ("BIOMARKER_PANELS", "PD-L1", "cancer_types", {"NSCLC"}),
+)
+_FIELD_CONTENT_IDS = tuple(f"{key}-{field}" for _, key, field, _ in EXPECTED_FIELD_CONTENTS)
+
+
+@pytest.mark.data_integrity
+class TestFieldContents:
+    """Test list-valued table fields contain their hallmark entries."""
+
+    @pytest.mark.parametrize(
+        "table,key,field,expected",
+        EXPECTED_FIELD_CONTENTS,
+        ids=_FIELD_CONTENT_IDS,
+    )
+    def test_field_contains(self, table, key, field, expected):
+        missing = expected - _FIELD_SETS[(table, key, field)]
+        assert not missing, f"{table}[{key!r}][{field!r}] missing {sorted(missing)}"
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -290,108 +335,143 @@ class TestBiomarkerPanels:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.mark.data_integrity
 class TestEntityAliases:
     """Test ENTITY_ALIASES maps correctly."""
 
-    @pytest.mark.parametrize("alias,expected", [
-        ("keytruda", "pembrolizumab"),
-        ("opdivo", "nivolumab"),
-        ("tagrisso", "osimertinib"),
-        ("zelboraf", "vemurafenib"),
-        ("tafinlar", "dabrafenib"),
-        ("lumakras", "sotorasib"),
-        ("vitrakvi", "larotrectinib"),
-        ("rozlytrek", "entrectinib"),
-        ("retevmo", "selpercatinib"),
-        ("lynparza", "olaparib"),
-        ("enhertu", "trastuzumab_deruxtecan"),
-        ("ibrance", "palbociclib"),
-    ])
-    def test_drug_alias(self, alias, expected):
-        assert ENTITY_ALIASES[alias] == expected
-
-    @pytest.mark.parametrize("alias,expected", [
-        ("her2", "HER2"),
-        ("erbb2", "HER2"),
-        ("lkb1", "STK11"),
-        ("p16", "CDKN2A"),
-    ])
-    def test_gene_alias(self, alias, expected):
-        assert ENTITY_ALIASES[alias] == expected
-
-    @pytest.mark.parametrize("alias,expected", [
-        ("non-small cell", "NSCLC"),
-        ("lung adenocarcinoma", "NSCLC"),
-        ("crc", "colorectal"),
-        ("rcc", "renal cell"),
-        ("hcc", "hepatocellular"),
-    ])
-    def test_cancer_type_alias(self, alias, expected):
-        assert ENTITY_ALIASES[alias] == expected
-
-    @pytest.mark.parametrize("alias,expected", [
-        ("msi high", "MSI-H"),
-        ("dmmr", "MSI-H"),
-        ("tmb high", "TMB-H"),
-        ("pdl1", "PD-L1"),
-    ])
-    def test_biomarker_alias(self, alias, expected):
-        assert ENTITY_ALIASES[alias] == expected
+    DRUG_ALIASES = {
+        "keytruda": "pembrolizumab",
+        "opdivo": "nivolumab",
+        "tagrisso": "osimertinib",
+        "zelboraf": "vemurafenib",
+        "tafinlar": "dabrafenib",
+        "lumakras": "sotorasib",
+        "vitrakvi": "larotrectinib",
+        "rozlytrek": "entrectinib",
+        "retevmo": "selpercatinib",
+        "lynparza": "olaparib",
+        "enhertu": "trastuzumab_deruxtecan",
+        "ibrance": "palbociclib",
+    }
+    GENE_ALIASES = {
+        "her2": "HER2",
+        "erbb2": "HER2",
+        "lkb1": "STK11",
+        "p16": "CDKN2A",
+    }
+    CANCER_TYPE_ALIASES = {
+        "non-small cell": "NSCLC",
+        "lung adenocarcinoma": "NSCLC",
+        "crc": "colorectal",
+        "rcc": "renal cell",
+        "hcc": "hepatocellular",
+    }
+    BIOMARKER_ALIASES = {
+        "msi high": "MSI-H",
+        "dmmr": "MSI-H",
+        "tmb high": "TMB-H",
+        "pdl1": "PD-L1",
+    }
+
+    @pytest.mark.parametrize("expected", (
+        pytest.param(DRUG_ALIASES, id="drug"),
+        pytest.param(GENE_ALIASES, id="gene"),
+        pytest.param(CANCER_TYPE_ALIASES, id="cancer_type"),
+        pytest.param(BIOMARKER_ALIASES, id="biomarker"),
+    ))
+    def test_aliases(self, expected):
+        actual = {alias: ENTITY_ALIASES.get(alias) for alias in expected}
+        assert actual == expected
 
     def test_minimum_alias_count(self):
         """Should have a substantial number of aliases."""
         assert len(ENTITY_ALIASES) >= 30
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Helper Function Tests: known vs unknown lookups
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+# (helper, argument) pairs that must resolve to non-empty context, covering
+# canonical keys, case-insensitive input, aliases and partial names
+HELPER_KNOWN = (
+    (get_target_context, "BRAF"),
+    (get_target_context, "EGFR"),
+    (get_target_context, "braf"),
+    (get_target_context, "her2"),
+    (get_therapy_context, "osimertinib"),
+    (get_therapy_context, "pembrolizumab"),
+    (get_therapy_context, "tagrisso"),
+    (get_resistance_context, "osimertinib"),
+    (get_resistance_context, "PARP inhibitors"),
+    (get_resistance_context, "BRAF"),
+    (get_pathway_context, "MAPK"),
+    (get_pathway_context, "PI3K_AKT_mTOR"),
+    (get_pathway_context, "DDR"),
+    (get_pathway_context, "DNA Damage"),
+    (get_biomarker_context, "TMB-H"),
+    (get_biomarker_context, "MSI-H"),
+    (get_biomarker_context, "PD-L1"),
+)
+HELPER_UNKNOWN = (
+    (get_target_context, "UNKNOWNGENE123"),
+    (get_therapy_context, "fake_drug_xyz"),
+    (get_resistance_context, "nonexistent_drug_xyz"),
+    (get_pathway_context, "nonexistent_pathway_xyz"),
+    (get_biomarker_context, "nonexistent_biomarker_xyz"),
+)
+
+
+def _helper_ids(pairs):
+    return [f"{fn.__name__}-{arg}" for fn, arg in pairs]
+
+
+class TestHelperLookups:
+    """Test every context helper on known and unknown inputs."""
+
+    @pytest.mark.parametrize("fn,arg", HELPER_KNOWN, ids=_helper_ids(HELPER_KNOWN))
+    def test_known_returns_context(self, fn, arg):
+        assert fn(arg)
+
+    @pytest.mark.parametrize("fn,arg", HELPER_UNKNOWN, ids=_helper_ids(HELPER_UNKNOWN))
+    def test_unknown_returns_empty(self, fn, arg):
+        assert fn(arg) == ""
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Helper Function Tests: get_target_context
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.fixture(scope="class")
+def braf_context():
+    """Target context for BRAF, built once per class."""
+    return get_target_context("BRAF")
+
+
 class TestGetTargetContext:
     """Test get_target_context returns data for known targets."""
 
-    def test_known_gene_returns_context(self):
-        context = get_target_context("BRAF")
-        assert len(context) > 0
-        assert "BRAF" in context
+    def test_known_gene_returns_context(self, braf_context):
+        assert "BRAF" in braf_context
 
     def test_egfr_context(self):
         context = get_target_context("EGFR")
         assert "EGFR" in context
-        assert "osimertinib" in context or "Epidermal" in context
-
-    def test_context_has_cancer_types(self):
-        context = get_target_context("BRAF")
-        assert "Cancer types:" in context or "melanoma" in context
-
-    def test_context_has_therapies(self):
-        context = get_target_context("BRAF")
-        assert "Targeted therapies:" in context or "vemurafenib" in context
-
-    def test_context_has_pathway(self):
-        context = get_target_context("BRAF")
-        assert "Pathway:" in context
+        assert _EGFR_CONTEXT_RE.search(context)
 
-    def test_context_has_evidence_level(self):
-        context = get_target_context("BRAF")
-        assert "Evidence level:" in context
+    def test_context_has_cancer_types(self, braf_context):
+        assert _CANCER_TYPES_RE.search(braf_context)
 
-    def test_unknown_gene_returns_empty(self):
-        context = get_target_context("UNKNOWNGENE123")
-        assert context == ""
+    def test_context_has_therapies(self, braf_context):
+        assert _TARGETED_THERAPIES_RE.search(braf_context)
 
-    def test_case_insensitive(self):
-        context_upper = get_target_context("BRAF")
-        context_lower = get_target_context("braf")
-        # Both should return non-empty context
-        assert len(context_upper) > 0
-        assert len(context_lower) > 0
+    def test_context_has_pathway(self, braf_context):
+        assert "Pathway:" in braf_context
 
-    def test_alias_resolution(self):
-        """Should resolve aliases like her2 -> HER2."""
-        context = get_target_context("her2")
-        assert len(context) > 0
+    def test_context_has_evidence_level(self, braf_context):
+        assert "Evidence level:" in braf_context
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -399,39 +479,35 @@ class TestGetTargetContext:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.fixture(scope="class")
+def osimertinib_therapy_context():
+    """Therapy context for osimertinib, built once per class."""
+    return get_therapy_context("osimertinib")
+
+
 class TestGetTherapyContext:
     """Test get_therapy_context returns data for known drugs."""
 
-    def test_known_drug_returns_context(self):
-        context = get_therapy_context("osimertinib")
-        assert len(context) > 0
-        assert "osimertinib" in context
+    def test_known_drug_returns_context(self, osimertinib_therapy_context):
+        assert "osimertinib" in osimertinib_therapy_context
 
     def test_pembrolizumab_context(self):
         context = get_therapy_context("pembrolizumab")
         assert "pembrolizumab" in context
         assert "Keytruda" in context
 
-    def test_context_has_category(self):
-        context = get_therapy_context("osimertinib")
-        assert "Category:" in context
+    def test_context_has_category(self, osimertinib_therapy_context):
+        assert "Category:" in osimertinib_therapy_context
 
-    def test_context_has_targets(self):
-        context = get_therapy_context("osimertinib")
-        assert "Targets:" in context or "EGFR" in context
+    def test_context_has_targets(self, osimertinib_therapy_context):
+        assert _THERAPY_TARGETS_RE.search(osimertinib_therapy_context)
 
-    def test_context_has_mechanism(self):
-        context = get_therapy_context("osimertinib")
-        assert "Mechanism:" in context
-
-    def test_unknown_drug_returns_empty(self):
-        context = get_therapy_context("fake_drug_xyz")
-        assert context == ""
+    def test_context_has_mechanism(self, osimertinib_therapy_context):
+        assert "Mechanism:" in osimertinib_therapy_context
 
     def test_alias_resolution(self):
         """Should resolve brand name aliases like tagrisso -> osimertinib."""
         context = get_therapy_context("tagrisso")
-        assert len(context) > 0
         assert "osimertinib" in context
 
 
@@ -445,27 +521,15 @@ class TestGetResistanceContext:
 
     def test_osimertinib_resistance(self):
         context = get_resistance_context("osimertinib")
-        assert len(context) > 0
         assert "C797S" in context
 
     def test_parp_inhibitor_resistance(self):
         context = get_resistance_context("PARP inhibitors")
-        assert len(context) > 0
         assert "reversion" in context.lower()
 
     def test_context_has_mutations(self):
         context = get_resistance_context("osimertinib")
-        assert "mutation" in context.lower() or "C797S" in context
-
-    def test_unknown_drug_returns_empty(self):
-        context = get_resistance_context("nonexistent_drug_xyz")
-        assert context == ""
-
-    def test_partial_name_match(self):
-        """Should match via partial drug class name."""
-        context = get_resistance_context("BRAF")
-        # Should find "BRAF V600 inhibitors"
-        assert len(context) > 0
+        assert _RESISTANCE_MUTATION_RE.search(context)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -473,43 +537,30 @@ class TestGetResistanceContext:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.fixture(scope="class")
+def mapk_pathway_context():
+    """Pathway context for MAPK, built once per class."""
+    return get_pathway_context("MAPK")
+
+
 class TestGetPathwayContext:
     """Test get_pathway_context returns data for known pathways."""
 
-    def test_mapk_pathway(self):
-        context = get_pathway_context("MAPK")
-        assert len(context) > 0
-        assert "MAPK" in context
+    def test_mapk_pathway(self, mapk_pathway_context):
+        assert "MAPK" in mapk_pathway_context
 
     def test_pi3k_pathway(self):
         context = get_pathway_context("PI3K_AKT_mTOR")
-        assert len(context) > 0
         assert "PI3K" in context
 
-    def test_ddr_pathway(self):
-        context = get_pathway_context("DDR")
-        assert len(context) > 0
-
-    def test_context_has_key_genes(self):
-        context = get_pathway_context("MAPK")
-        assert "Key genes:" in context or "KRAS" in context
-
-    def test_context_has_therapeutic_targets(self):
-        context = get_pathway_context("MAPK")
-        assert "Therapeutic targets:" in context
-
-    def test_context_has_clinical_relevance(self):
-        context = get_pathway_context("MAPK")
-        assert len(context) > 50  # Should have substantial content
+    def test_context_has_key_genes(self, mapk_pathway_context):
+        assert _KEY_GENES_RE.search(mapk_pathway_context)
 
-    def test_unknown_pathway_returns_empty(self):
-        context = get_pathway_context("nonexistent_pathway_xyz")
-        assert context == ""
+    def test_context_has_therapeutic_targets(self, mapk_pathway_context):
+        assert "Therapeutic targets:" in mapk_pathway_context
 
-    def test_partial_name_match(self):
-        """Should match via partial pathway name."""
-        context = get_pathway_context("DNA Damage")
-        assert len(context) > 0
+    def test_context_has_clinical_relevance(self, mapk_pathway_context):
+        assert len(mapk_pathway_context) > 50  # Should have substantial content
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -517,35 +568,31 @@ class TestGetPathwayContext:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.fixture(scope="class")
+def tmb_context():
+    """Biomarker context for TMB-H, built once per class."""
+    return get_biomarker_context("TMB-H")
+
+
 class TestGetBiomarkerContext:
     """Test get_biomarker_context returns data for known biomarkers."""
 
-    def test_tmb_h_context(self):
-        context = get_biomarker_context("TMB-H")
-        assert len(context) > 0
-        assert "TMB" in context or "Tumor Mutational" in context
+    def test_tmb_h_context(self, tmb_context):
+        assert _TMB_RE.search(tmb_context)
 
     def test_msi_h_context(self):
         context = get_biomarker_context("MSI-H")
-        assert len(context) > 0
-        assert "MSI" in context or "Microsatellite" in context
+        assert _MSI_RE.search(context)
 
     def test_pdl1_context(self):
         context = get_biomarker_context("PD-L1")
-        assert len(context) > 0
         assert "PD-L1" in context
 
-    def test_context_has_testing_method(self):
-        context = get_biomarker_context("TMB-H")
-        assert "Testing:" in context or "NGS" in context
+    def test_context_has_testing_method(self, tmb_context):
+        assert _TESTING_METHOD_RE.search(tmb_context)
 
-    def test_context_has_cutoff(self):
-        context = get_biomarker_context("TMB-H")
-        assert "Cutoff:" in context or "10" in context
-
-    def test_unknown_biomarker_returns_empty(self):
-        context = get_biomarker_context("nonexistent_biomarker_xyz")
-        assert context == ""
+    def test_context_has_cutoff(self, tmb_context):
+        assert _CUTOFF_RE.search(tmb_context)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -553,51 +600,63 @@ class TestGetBiomarkerContext:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+_RESOLVE_INPUTS = (
+    "BRAF", "osimertinib", "MAPK", "TMB-H", "tagrisso", "her2",
+    "completely_unknown_entity_xyz", "EGFR",
+)
+
+
+@pytest.fixture(scope="class")
+def resolved():
+    """resolve_comparison_entity output for every input the class checks."""
+    return {entity: resolve_comparison_entity(entity) for entity in _RESOLVE_INPUTS}
+
+
 class TestResolveComparisonEntity:
     """Test resolve_comparison_entity resolves aliases and entity types."""
 
-    def test_resolve_gene_target(self):
-        result = resolve_comparison_entity("BRAF")
+    def test_resolve_gene_target(self, resolved):
+        result = resolved["BRAF"]
         assert result is not None
         assert result["type"] == "target"
         assert result["canonical"] == "BRAF"
 
-    def test_resolve_therapy(self):
-        result = resolve_comparison_entity("osimertinib")
+    def test_resolve_therapy(self, resolved):
+        result = resolved["osimertinib"]
         assert result is not None
         assert result["type"] == "therapy"
         assert result["canonical"] == "osimertinib"
 
-    def test_resolve_pathway(self):
-        result = resolve_comparison_entity("MAPK")
+    def test_resolve_pathway(self, resolved):
+        result = resolved["MAPK"]
         assert result is not None
         assert result["type"] == "pathway"
 
-    def test_resolve_biomarker(self):
-        result = resolve_comparison_entity("TMB-H")
+    def test_resolve_biomarker(self, resolved):
+        result = resolved["TMB-H"]
         assert result is not None
         assert result["type"] == "biomarker"
 
-    def test_resolve_brand_name_alias(self):
+    def test_resolve_brand_name_alias(self, resolved):
         """Brand name should resolve to generic drug."""
-        result = resolve_comparison_entity("tagrisso")
+        result = resolved["tagrisso"]
         assert result is not None
         assert result["type"] == "therapy"
         assert result["canonical"] == "osimertinib"
 
-    def test_resolve_gene_alias(self):
+    def test_resolve_gene_alias(self, resolved):
         """Gene alias should resolve to canonical gene."""
-        result = resolve_comparison_entity("her2")
+        result = resolved["her2"]
         assert result is not None
         assert result["type"] == "target"
 
-    def test_unknown_entity_returns_none(self):
-        result = resolve_comparison_entity("completely_unknown_entity_xyz")
+    def test_unknown_entity_returns_none(self, resolved):
+        result = resolved["completely_unknown_entity_xyz"]
         assert result is None
 
-    def test_result_has_data(self):
+    def test_result_has_data(self, resolved):
         """Resolved entity should include the underlying data dict."""
-        result = resolve_comparison_entity("EGFR")
+        result = resolved["EGFR"]
         assert result is not None
         assert "data" in result
         assert isinstance(result["data"], dict)
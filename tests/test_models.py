@@ -5,16 +5,12 @@ Validates all enums, domain models, embedding text generation,
 and agent I/O types defined in src/models.py.
 """
 
-import sys
-from datetime import datetime
-from pathlib import Path
+from datetime import datetime, timezone
 
 import pytest
+from pydantic import ValidationError
 
-_AGENT_ROOT = Path(__file__).resolve().parents[1]
-if str(_AGENT_ROOT) not in sys.path:
-    sys.path.insert(0, str(_AGENT_ROOT))
-
+from src import models
 from src.models import (
     AgentQuery,
     AgentResponse,
@@ -48,198 +44,233 @@ from src.models import (
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-class TestCancerType:
-    """Verify CancerType enum members."""
-
-    def test_nsclc(self):
-        assert CancerType.NSCLC.value == "nsclc"
+# Actual member names of every enum, built in one pass at import
+_ENUM_NAMES = {
+    cls: frozenset(m.name for m in cls)
+    for cls in (
+        CancerType,
+        VariantType,
+        EvidenceLevel,
+        TherapyCategory,
+        TrialPhase,
+        TrialStatus,
+        ResponseCategory,
+        BiomarkerType,
+        PathwayName,
+        GuidelineOrg,
+        SourceType,
+    )
+}
+
+# Expected enum member names
+_CANCER_TYPE_EXPECTED = frozenset({
+    "NSCLC", "SCLC", "BREAST", "COLORECTAL", "MELANOMA",
+    "PANCREATIC", "OVARIAN", "PROSTATE", "RENAL", "BLADDER",
+    "HEAD_NECK", "HEPATOCELLULAR", "GASTRIC", "GLIOBLASTOMA",
+    "AML", "CML", "ALL", "CLL", "DLBCL", "MULTIPLE_MYELOMA", "OTHER",
+})
+
+_VARIANT_TYPE_EXPECTED = frozenset({
+    "SNV", "INDEL", "CNV_AMP", "CNV_DEL", "FUSION", "REARRANGEMENT", "SV",
+})
+
+_EVIDENCE_LEVEL_EXPECTED = frozenset({
+    "LEVEL_A", "LEVEL_B", "LEVEL_C", "LEVEL_D", "LEVEL_E",
+})
+
+_THERAPY_CATEGORY_EXPECTED = frozenset({
+    "TARGETED", "IMMUNOTHERAPY", "CHEMOTHERAPY", "HORMONAL",
+    "COMBINATION", "RADIOTHERAPY", "CELL_THERAPY",
+    "ADC", "BISPECIFIC",
+})
+
+_TRIAL_PHASE_EXPECTED = frozenset({
+    "EARLY_PHASE_1", "PHASE_1", "PHASE_1_2", "PHASE_2",
+    "PHASE_2_3", "PHASE_3", "PHASE_4", "NA",
+})
+
+_TRIAL_STATUS_EXPECTED = frozenset({
+    "NOT_YET_RECRUITING", "RECRUITING", "ENROLLING_BY_INVITATION",
+    "ACTIVE_NOT_RECRUITING", "SUSPENDED", "TERMINATED",
+    "COMPLETED", "WITHDRAWN", "UNKNOWN",
+})
+
+_RESPONSE_CATEGORY_EXPECTED = frozenset({"CR", "PR", "SD", "PD", "NE"})
+
+_BIOMARKER_TYPE_EXPECTED = frozenset({
+    "PREDICTIVE", "PROGNOSTIC", "DIAGNOSTIC",
+    "MONITORING", "RESISTANCE", "PHARMACODYNAMIC",
+    "SCREENING", "THERAPEUTIC_SELECTION",
+})
+
+_PATHWAY_NAME_EXPECTED = frozenset({
+    "MAPK", "PI3K_AKT_MTOR", "DDR", "CELL_CYCLE", "APOPTOSIS",
+    "WNT", "NOTCH", "HEDGEHOG", "JAK_STAT", "ANGIOGENESIS",
+    "HIPPO", "NF_KB", "TGF_BETA",
+})
+
+_GUIDELINE_ORG_EXPECTED = frozenset({
+    "NCCN", "ESMO", "ASCO", "WHO", "CAP_AMP", "FDA", "EMA", "AACR",
+})
+
+_SOURCE_TYPE_EXPECTED = frozenset({"PUBMED", "PMC", "PREPRINT", "MANUAL"})
 
-    def test_breast(self):
-        assert CancerType.BREAST.value == "breast"
 
-    def test_melanoma(self):
-        assert CancerType.MELANOMA.value == "melanoma"
-
-    def test_colorectal(self):
-        assert CancerType.COLORECTAL.value == "colorectal"
+class TestCancerType:
+    """Verify CancerType enum members."""
 
-    def test_other(self):
-        assert CancerType.OTHER.value == "other"
+    @pytest.mark.parametrize("member,value", [
+        pytest.param(CancerType.NSCLC, "nsclc", id="nsclc"),
+        pytest.param(CancerType.BREAST, "breast", id="breast"),
+        pytest.param(CancerType.MELANOMA, "melanoma", id="melanoma"),
+        pytest.param(CancerType.COLORECTAL, "colorectal", id="colorectal"),
+        pytest.param(CancerType.OTHER, "other", id="other"),
+    ])
+    def test_value(self, member, value):
+        assert member.value == value
 
     def test_expected_members(self):
-        names = {m.name for m in CancerType}
-        expected = {
-            "NSCLC", "SCLC", "BREAST", "COLORECTAL", "MELANOMA",
-            "PANCREATIC", "OVARIAN", "PROSTATE", "RENAL", "BLADDER",
-            "HEAD_NECK", "HEPATOCELLULAR", "GASTRIC", "GLIOBLASTOMA",
-            "AML", "CML", "ALL", "CLL", "DLBCL", "MULTIPLE_MYELOMA", "OTHER",
-        }
-        assert expected.issubset(names)
+        assert _ENUM_NAMES[CancerType] >= _CANCER_TYPE_EXPECTED
 
 
 class TestVariantType:
     """Verify VariantType enum members."""
 
-    def test_snv(self):
-        assert VariantType.SNV.value == "snv"
-
-    def test_fusion(self):
-        assert VariantType.FUSION.value == "fusion"
-
-    def test_cnv_amp(self):
-        assert VariantType.CNV_AMP.value == "cnv_amplification"
+    @pytest.mark.parametrize("member,value", [
+        pytest.param(VariantType.SNV, "snv", id="snv"),
+        pytest.param(VariantType.FUSION, "fusion", id="fusion"),
+        pytest.param(VariantType.CNV_AMP, "cnv_amplification", id="cnv_amp"),
+    ])
+    def test_value(self, member, value):
+        assert member.value == value
 
     def test_expected_members(self):
-        names = {m.name for m in VariantType}
-        expected = {"SNV", "INDEL", "CNV_AMP", "CNV_DEL", "FUSION", "REARRANGEMENT", "SV"}
-        assert expected == names
+        assert _ENUM_NAMES[VariantType] == _VARIANT_TYPE_EXPECTED
 
 
 class TestEvidenceLevel:
     """Verify EvidenceLevel enum members."""
 
-    def test_level_a(self):
-        assert EvidenceLevel.LEVEL_A.value == "A"
-
-    def test_level_e(self):
-        assert EvidenceLevel.LEVEL_E.value == "E"
+    @pytest.mark.parametrize("member,value", [
+        pytest.param(EvidenceLevel.LEVEL_A, "A", id="level_a"),
+        pytest.param(EvidenceLevel.LEVEL_E, "E", id="level_e"),
+    ])
+    def test_value(self, member, value):
+        assert member.value == value
 
     def test_expected_members(self):
-        names = {m.name for m in EvidenceLevel}
-        assert names == {"LEVEL_A", "LEVEL_B", "LEVEL_C", "LEVEL_D", "LEVEL_E"}
+        assert _ENUM_NAMES[EvidenceLevel] == _EVIDENCE_LEVEL_EXPECTED
 
 
 class TestTherapyCategory:
     """Verify TherapyCategory enum members."""
 
-    def test_targeted(self):
-        assert TherapyCategory.TARGETED.value == "targeted"
-
-    def test_immunotherapy(self):
-        assert TherapyCategory.IMMUNOTHERAPY.value == "immunotherapy"
+    @pytest.mark.parametrize("member,value", [
+        pytest.param(TherapyCategory.TARGETED, "targeted", id="targeted"),
+        pytest.param(TherapyCategory.IMMUNOTHERAPY, "immunotherapy", id="immunotherapy"),
+    ])
+    def test_value(self, member, value):
+        assert member.value == value
 
     def test_expected_members(self):
-        names = {m.name for m in TherapyCategory}
-        expected = {
-            "TARGETED", "IMMUNOTHERAPY", "CHEMOTHERAPY", "HORMONAL",
-            "COMBINATION", "RADIOTHERAPY", "CELL_THERAPY",
-            "ADC", "BISPECIFIC",
-        }
-        assert expected == names
+        assert _ENUM_NAMES[TherapyCategory] == _THERAPY_CATEGORY_EXPECTED
 
 
 class TestTrialPhase:
     """Verify TrialPhase enum members."""
 
-    def test_phase_3(self):
-        assert TrialPhase.PHASE_3.value == "Phase 3"
-
-    def test_na(self):
-        assert TrialPhase.NA.value == "N/A"
+    @pytest.mark.parametrize("member,value", [
+        pytest.param(TrialPhase.PHASE_3, "Phase 3", id="phase_3"),
+        pytest.param(TrialPhase.NA, "N/A", id="na"),
+    ])
+    def test_value(self, member, value):
+        assert member.value == value
 
     def test_expected_members(self):
-        names = {m.name for m in TrialPhase}
-        expected = {
-            "EARLY_PHASE_1", "PHASE_1", "PHASE_1_2", "PHASE_2",
-            "PHASE_2_3", "PHASE_3", "PHASE_4", "NA",
-        }
-        assert expected == names
+        assert _ENUM_NAMES[TrialPhase] == _TRIAL_PHASE_EXPECTED
 
 
 class TestTrialStatus:
     """Verify TrialStatus enum members."""
 
-    def test_recruiting(self):
-        assert TrialStatus.RECRUITING.value == "Recruiting"
-
-    def test_completed(self):
-        assert TrialStatus.COMPLETED.value == "Completed"
+    @pytest.mark.parametrize("member,value", [
+        pytest.param(TrialStatus.RECRUITING, "Recruiting", id="recruiting"),
+        pytest.param(TrialStatus.COMPLETED, "Completed", id="completed"),
+    ])
+    def test_value(self, member, value):
+        assert member.value == value
 
     def test_expected_members(self):
-        names = {m.name for m in TrialStatus}
-        expected = {
-            "NOT_YET_RECRUITING", "RECRUITING", "ENROLLING_BY_INVITATION",
-            "ACTIVE_NOT_RECRUITING", "SUSPENDED", "TERMINATED",
-            "COMPLETED", "WITHDRAWN", "UNKNOWN",
-        }
-        assert expected == names
+        assert _ENUM_NAMES[TrialStatus] == _TRIAL_STATUS_EXPECTED
 
 
 class TestResponseCategory:
     """Verify ResponseCategory enum members."""
 
-    def test_cr(self):
-        assert ResponseCategory.CR.value == "complete_response"
-
-    def test_pd(self):
-        assert ResponseCategory.PD.value == "progressive_disease"
+    @pytest.mark.parametrize("member,value", [
+        pytest.param(ResponseCategory.CR, "complete_response", id="cr"),
+        pytest.param(ResponseCategory.PD, "progressive_disease", id="pd"),
+    ])
+    def test_value(self, member, value):
+        assert member.value == value
 
     def test_expected_members(self):
-        names = {m.name for m in ResponseCategory}
-        assert names == {"CR", "PR", "SD", "PD", "NE"}
+        assert _ENUM_NAMES[ResponseCategory] == _RESPONSE_CATEGORY_EXPECTED
 
 
 class TestBiomarkerType:
     """Verify BiomarkerType enum members."""
 
-    def test_predictive(self):
-        assert BiomarkerType.PREDICTIVE.value == "predictive"
-
-    def test_resistance(self):
-        assert BiomarkerType.RESISTANCE.value == "resistance"
+    @pytest.mark.parametrize("member,value", [
+        pytest.param(BiomarkerType.PREDICTIVE, "predictive", id="predictive"),
+        pytest.param(BiomarkerType.RESISTANCE, "resistance", id="resistance"),
+    ])
+    def test_value(self, member, value):
+        assert member.value == value
 
     def test_expected_members(self):
-        names = {m.name for m in BiomarkerType}
-        expected = {
-            "PREDICTIVE", "PROGNOSTIC", "DIAGNOSTIC",
-            "MONITORING", "RESISTANCE", "PHARMACODYNAMIC",
-            "SCREENING", "THERAPEUTIC_SELECTION",
-        }
-        assert expected == names
+        assert _ENUM_NAMES[BiomarkerType] == _BIOMARKER_TYPE_EXPECTED
 
 
 class TestPathwayName:
     """Verify PathwayName enum members."""
 
-    def test_mapk(self):
-        assert PathwayName.MAPK.value == "mapk"
-
-    def test_pi3k(self):
-        assert PathwayName.PI3K_AKT_MTOR.value == "pi3k_akt_mtor"
+    @pytest.mark.parametrize("member,value", [
+        pytest.param(PathwayName.MAPK, "mapk", id="mapk"),
+        pytest.param(PathwayName.PI3K_AKT_MTOR, "pi3k_akt_mtor", id="pi3k"),
+    ])
+    def test_value(self, member, value):
+        assert member.value == value
 
     def test_expected_members(self):
-        names = {m.name for m in PathwayName}
-        expected = {
-            "MAPK", "PI3K_AKT_MTOR", "DDR", "CELL_CYCLE", "APOPTOSIS",
-            "WNT", "NOTCH", "HEDGEHOG", "JAK_STAT", "ANGIOGENESIS",
-            "HIPPO", "NF_KB", "TGF_BETA",
-        }
-        assert expected == names
+        assert _ENUM_NAMES[PathwayName] == _PATHWAY_NAME_EXPECTED
 
 
 class TestGuidelineOrg:
     """Verify GuidelineOrg enum members."""
 
-    def test_nccn(self):
-        assert GuidelineOrg.NCCN.value == "NCCN"
-
-    def test_esmo(self):
-        assert GuidelineOrg.ESMO.value == "ESMO"
+    @pytest.mark.parametrize("member,value", [
+        pytest.param(GuidelineOrg.NCCN, "NCCN", id="nccn"),
+        pytest.param(GuidelineOrg.ESMO, "ESMO", id="esmo"),
+    ])
+    def test_value(self, member, value):
+        assert member.value == value
 
     def test_expected_members(self):
-        names = {m.name for m in GuidelineOrg}
-        assert names == {"NCCN", "ESMO", "ASCO", "WHO", "CAP_AMP", "FDA", "EMA", "AACR"}
+        assert _ENUM_NAMES[GuidelineOrg] == _GUIDELINE_ORG_EXPECTED
 
 
 class TestSourceType:
     """Verify SourceType enum members."""
 
-    def test_pubmed(self):
-        assert SourceType.PUBMED.value == "pubmed"
+    @pytest.mark.parametrize("member,value", [
+        pytest.param(SourceType.PUBMED, "pubmed", id="pubmed"),
+    ])
+    def test_value(self, member, value):
+        assert member.value == value
 
     def test_expected_members(self):
-        names = {m.name for m in SourceType}
-        assert names == {"PUBMED", "PMC", "PREPRINT", "MANUAL"}
+        assert _ENUM_NAMES[SourceType] == _SOURCE_TYPE_EXPECTED
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -247,223 +278,273 @@ class TestSourceType:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+# Fixed clock for the generated_at / timestamp default factories
+_FROZEN_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return _FROZEN_NOW
+
+
+@pytest.fixture(scope="class")
+def frozen_now():
+    """Patch ``src.models.datetime`` so default timestamps equal ``_FROZEN_NOW``."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(models, "datetime", _FrozenDatetime)
+        yield _FROZEN_NOW
+
+
+# Field values for the read-only model fixtures
+_VARIANT_FIELDS = {
+    "id": "CIViC:12",
+    "gene": "EGFR",
+    "variant_name": "L858R",
+    "variant_type": VariantType.SNV,
+    "cancer_type": CancerType.NSCLC,
+    "evidence_level": EvidenceLevel.LEVEL_A,
+    "drugs": ["osimertinib", "erlotinib"],
+    "text_summary": "EGFR L858R is a sensitising mutation.",
+    "clinical_significance": "Pathogenic",
+}
+
+_BIOMARKER_FIELDS = {
+    "id": "BM:TMB-H",
+    "name": "Tumor Mutational Burden High",
+    "biomarker_type": BiomarkerType.PREDICTIVE,
+    "cancer_types": [CancerType.NSCLC, CancerType.MELANOMA],
+    "predictive_value": "Pembrolizumab response",
+    "testing_method": "NGS panel",
+    "clinical_cutoff": ">=10 mut/Mb",
+    "text_summary": "TMB-H predicts immunotherapy benefit.",
+    "evidence_level": EvidenceLevel.LEVEL_A,
+}
+
+_THERAPY_FIELDS = {
+    "id": "TX:osimertinib",
+    "drug_name": "osimertinib",
+    "category": TherapyCategory.TARGETED,
+    "targets": ["EGFR"],
+    "approved_indications": ["EGFR-mutant NSCLC"],
+    "evidence_level": EvidenceLevel.LEVEL_A,
+    "text_summary": "Third-generation EGFR TKI.",
+    "mechanism_of_action": "Irreversible EGFR C797 binding",
+}
+
+_TRIAL_FIELDS = {
+    "id": "NCT02628067",
+    "title": "KEYNOTE-158",
+    "text_summary": "Phase II basket trial of pembrolizumab in MSI-H tumors.",
+    "phase": TrialPhase.PHASE_2,
+    "status": TrialStatus.ACTIVE_NOT_RECRUITING,
+    "cancer_types": [CancerType.COLORECTAL, CancerType.GASTRIC],
+    "biomarker_criteria": ["MSI-H", "TMB-H"],
+    "outcome_summary": "ORR 34.3%",
+}
+
+_GUIDELINE_FIELDS = {
+    "id": "GL:NCCN-NSCLC-2025.2",
+    "org": GuidelineOrg.NCCN,
+    "cancer_type": CancerType.NSCLC,
+    "version": "2.2025",
+    "year": 2025,
+    "key_recommendations": [
+        "Molecular testing for all non-squamous NSCLC",
+        "Osimertinib first-line for EGFR-mutant NSCLC",
+    ],
+    "text_summary": "NCCN NSCLC guidelines version 2.2025.",
+    "evidence_level": EvidenceLevel.LEVEL_A,
+}
+
+_RESISTANCE_FIELDS = {
+    "id": "RM:EGFR-T790M",
+    "primary_therapy": "erlotinib",
+    "gene": "EGFR",
+    "mechanism": "T790M gatekeeper mutation",
+    "bypass_pathway": "MAPK reactivation",
+    "alternative_therapies": ["osimertinib"],
+    "text_summary": "T790M confers resistance to first-gen EGFR TKIs.",
+}
+
+_OUTCOME_FIELDS = {
+    "id": "OUT:001",
+    "case_id": "CASE:XYZ",
+    "therapy": "osimertinib",
+    "cancer_type": CancerType.NSCLC,
+    "response": ResponseCategory.PR,
+    "duration_months": 14.2,
+    "toxicities": ["rash", "diarrhea"],
+    "biomarkers_at_baseline": {"EGFR": "L858R", "PD-L1_TPS": "40"},
+    "text_summary": "Partial response on osimertinib for 14 months.",
+}
+
+
+# Read-only model instances, validated once per module
+@pytest.fixture(scope="module")
+def variant():
+    return OncologyVariant.model_validate(_VARIANT_FIELDS)
+
+
+@pytest.fixture(scope="module")
+def biomarker():
+    return OncologyBiomarker.model_validate(_BIOMARKER_FIELDS)
+
+
+@pytest.fixture(scope="module")
+def therapy():
+    return OncologyTherapy.model_validate(_THERAPY_FIELDS)
+
+
+@pytest.fixture(scope="module")
+def trial():
+    return OncologyTrial.model_validate(_TRIAL_FIELDS)
+
+
+@pytest.fixture(scope="module")
+def guideline():
+    return OncologyGuideline.model_validate(_GUIDELINE_FIELDS)
+
+
+@pytest.fixture(scope="module")
+def resistance():
+    return ResistanceMechanism.model_validate(_RESISTANCE_FIELDS)
+
+
+@pytest.fixture(scope="module")
+def outcome():
+    return OutcomeRecord.model_validate(_OUTCOME_FIELDS)
+
+
+# Substrings each model's embedding text must contain
+EMBEDDING_NEEDLES = {
+    "variant": ("EGFR", "L858R", "snv", "A", "osimertinib", "nsclc", "Pathogenic"),
+    "biomarker": ("Tumor Mutational Burden", "predictive", "NGS panel", ">=10 mut/Mb"),
+    "therapy": ("osimertinib", "targeted", "EGFR", "Irreversible"),
+    "trial": ("KEYNOTE-158", "Phase 2", "Active, not recruiting", "MSI-H", "ORR 34.3%"),
+    "guideline": ("NCCN", "nsclc", "2.2025", "2025", "Molecular testing"),
+    "resistance": ("erlotinib", "EGFR", "T790M", "MAPK", "osimertinib"),
+    "outcome": (
+        "osimertinib", "nsclc", "partial_response", "14.2 months", "rash", "EGFR=L858R",
+    ),
+}
+
+
 class TestOncologyVariant:
     """Test OncologyVariant creation and to_embedding_text()."""
 
-    @pytest.fixture
-    def variant(self):
-        return OncologyVariant(
-            id="CIViC:12",
-            gene="EGFR",
-            variant_name="L858R",
-            variant_type=VariantType.SNV,
-            cancer_type=CancerType.NSCLC,
-            evidence_level=EvidenceLevel.LEVEL_A,
-            drugs=["osimertinib", "erlotinib"],
-            text_summary="EGFR L858R is a sensitising mutation.",
-            clinical_significance="Pathogenic",
-        )
-
     def test_creation(self, variant):
         assert variant.gene == "EGFR"
         assert variant.variant_name == "L858R"
         assert variant.variant_type == VariantType.SNV
         assert variant.evidence_level == EvidenceLevel.LEVEL_A
 
-    def test_embedding_text(self, variant):
-        text = variant.to_embedding_text()
-        assert "EGFR" in text
-        assert "L858R" in text
-        assert "snv" in text
-        assert "A" in text
-        assert "osimertinib" in text
-        assert "nsclc" in text
-        assert "Pathogenic" in text
+    @pytest.mark.parametrize("needle", EMBEDDING_NEEDLES["variant"])
+    def test_embedding_text(self, variant, needle):
+        assert needle in variant.to_embedding_text()
 
 
 class TestOncologyBiomarker:
     """Test OncologyBiomarker creation and to_embedding_text()."""
 
-    @pytest.fixture
-    def biomarker(self):
-        return OncologyBiomarker(
-            id="BM:TMB-H",
-            name="Tumor Mutational Burden High",
-            biomarker_type=BiomarkerType.PREDICTIVE,
-            cancer_types=[CancerType.NSCLC, CancerType.MELANOMA],
-            predictive_value="Pembrolizumab response",
-            testing_method="NGS panel",
-            clinical_cutoff=">=10 mut/Mb",
-            text_summary="TMB-H predicts immunotherapy benefit.",
-            evidence_level=EvidenceLevel.LEVEL_A,
-        )
-
     def test_creation(self, biomarker):
         assert biomarker.name == "Tumor Mutational Burden High"
         assert biomarker.biomarker_type == BiomarkerType.PREDICTIVE
         assert CancerType.NSCLC in biomarker.cancer_types
 
-    def test_embedding_text(self, biomarker):
-        text = biomarker.to_embedding_text()
-        assert "Tumor Mutational Burden" in text
-        assert "predictive" in text
-        assert "NGS panel" in text
-        assert ">=10 mut/Mb" in text
+    @pytest.mark.parametrize("needle", EMBEDDING_NEEDLES["biomarker"])
+    def test_embedding_text(self, biomarker, needle):
+        assert needle in biomarker.to_embedding_text()
 
 
 class TestOncologyTherapy:
     """Test OncologyTherapy creation and to_embedding_text()."""
 
-    @pytest.fixture
-    def therapy(self):
-        return OncologyTherapy(
-            id="TX:osimertinib",
-            drug_name="osimertinib",
-            category=TherapyCategory.TARGETED,
-            targets=["EGFR"],
-            approved_indications=["EGFR-mutant NSCLC"],
-            evidence_level=EvidenceLevel.LEVEL_A,
-            text_summary="Third-generation EGFR TKI.",
-            mechanism_of_action="Irreversible EGFR C797 binding",
-        )
-
     def test_creation(self, therapy):
         assert therapy.drug_name == "osimertinib"
         assert therapy.category == TherapyCategory.TARGETED
         assert "EGFR" in therapy.targets
 
-    def test_embedding_text(self, therapy):
-        text = therapy.to_embedding_text()
-        assert "osimertinib" in text
-        assert "targeted" in text
-        assert "EGFR" in text
-        assert "Irreversible" in text
+    @pytest.mark.parametrize("needle", EMBEDDING_NEEDLES["therapy"])
+    def test_embedding_text(self, therapy, needle):
+        assert needle in therapy.to_embedding_text()
 
 
 class TestOncologyTrial:
     """Test OncologyTrial creation and to_embedding_text()."""
 
-    @pytest.fixture
-    def trial(self):
-        return OncologyTrial(
-            id="NCT02628067",
-            title="KEYNOTE-158",
-            text_summary="Phase II basket trial of pembrolizumab in MSI-H tumors.",
-            phase=TrialPhase.PHASE_2,
-            status=TrialStatus.ACTIVE_NOT_RECRUITING,
-            cancer_types=[CancerType.COLORECTAL, CancerType.GASTRIC],
-            biomarker_criteria=["MSI-H", "TMB-H"],
-            outcome_summary="ORR 34.3%",
-        )
-
     def test_creation(self, trial):
         assert trial.id == "NCT02628067"
         assert trial.phase == TrialPhase.PHASE_2
         assert trial.status == TrialStatus.ACTIVE_NOT_RECRUITING
         assert CancerType.COLORECTAL in trial.cancer_types
 
-    def test_embedding_text(self, trial):
-        text = trial.to_embedding_text()
-        assert "KEYNOTE-158" in text
-        assert "Phase 2" in text
-        assert "Active, not recruiting" in text
-        assert "MSI-H" in text
-        assert "ORR 34.3%" in text
+    @pytest.mark.parametrize("needle", EMBEDDING_NEEDLES["trial"])
+    def test_embedding_text(self, trial, needle):
+        assert needle in trial.to_embedding_text()
 
 
 class TestOncologyGuideline:
     """Test OncologyGuideline creation and to_embedding_text()."""
 
-    @pytest.fixture
-    def guideline(self):
-        return OncologyGuideline(
-            id="GL:NCCN-NSCLC-2025.2",
-            org=GuidelineOrg.NCCN,
-            cancer_type=CancerType.NSCLC,
-            version="2.2025",
-            year=2025,
-            key_recommendations=[
-                "Molecular testing for all non-squamous NSCLC",
-                "Osimertinib first-line for EGFR-mutant NSCLC",
-            ],
-            text_summary="NCCN NSCLC guidelines version 2.2025.",
-            evidence_level=EvidenceLevel.LEVEL_A,
-        )
-
     def test_creation(self, guideline):
         assert guideline.org == GuidelineOrg.NCCN
         assert guideline.cancer_type == CancerType.NSCLC
         assert guideline.year == 2025
         assert len(guideline.key_recommendations) == 2
 
-    def test_embedding_text(self, guideline):
-        text = guideline.to_embedding_text()
-        assert "NCCN" in text
-        assert "nsclc" in text
-        assert "2.2025" in text
-        assert "2025" in text
-        assert "Molecular testing" in text
+    @pytest.mark.parametrize("needle", EMBEDDING_NEEDLES["guideline"])
+    def test_embedding_text(self, guideline, needle):
+        assert needle in guideline.to_embedding_text()
 
 
 class TestResistanceMechanism:
     """Test ResistanceMechanism creation and to_embedding_text()."""
 
-    @pytest.fixture
-    def resistance(self):
-        return ResistanceMechanism(
-            id="RM:EGFR-T790M",
-            primary_therapy="erlotinib",
-            gene="EGFR",
-            mechanism="T790M gatekeeper mutation",
-            bypass_pathway="MAPK reactivation",
-            alternative_therapies=["osimertinib"],
-            text_summary="T790M confers resistance to first-gen EGFR TKIs.",
-        )
-
     def test_creation(self, resistance):
         assert resistance.gene == "EGFR"
         assert resistance.mechanism == "T790M gatekeeper mutation"
         assert "osimertinib" in resistance.alternative_therapies
 
-    def test_embedding_text(self, resistance):
-        text = resistance.to_embedding_text()
-        assert "erlotinib" in text
-        assert "EGFR" in text
-        assert "T790M" in text
-        assert "MAPK" in text
-        assert "osimertinib" in text
+    @pytest.mark.parametrize("needle", EMBEDDING_NEEDLES["resistance"])
+    def test_embedding_text(self, resistance, needle):
+        assert needle in resistance.to_embedding_text()
 
 
 class TestOutcomeRecord:
     """Test OutcomeRecord creation and to_embedding_text()."""
 
-    @pytest.fixture
-    def outcome(self):
-        return OutcomeRecord(
-            id="OUT:001",
-            case_id="CASE:XYZ",
-            therapy="osimertinib",
-            cancer_type=CancerType.NSCLC,
-            response=ResponseCategory.PR,
-            duration_months=14.2,
-            toxicities=["rash", "diarrhea"],
-            biomarkers_at_baseline={"EGFR": "L858R", "PD-L1_TPS": "40"},
-            text_summary="Partial response on osimertinib for 14 months.",
-        )
-
     def test_creation(self, outcome):
         assert outcome.therapy == "osimertinib"
         assert outcome.response == ResponseCategory.PR
         assert outcome.duration_months == 14.2
 
-    def test_embedding_text(self, outcome):
-        text = outcome.to_embedding_text()
-        assert "osimertinib" in text
-        assert "nsclc" in text
-        assert "partial_response" in text
-        assert "14.2 months" in text
-        assert "rash" in text
-        assert "EGFR=L858R" in text
+    @pytest.mark.parametrize("needle", EMBEDDING_NEEDLES["outcome"])
+    def test_embedding_text(self, outcome, needle):
+        assert needle in outcome.to_embedding_text()
+
+
+# Embedding text of minimal snapshots with string and dict variants
+@pytest.fixture(scope="module")
+def case_string_variants_text():
+    return CaseSnapshot(
+        case_id="CASE:003",
+        patient_id="PT-003",
+        cancer_type="nsclc",
+        variants=["EGFR L858R"],
+        text_summary="Test case.",
+    ).to_embedding_text()
+
+
+@pytest.fixture(scope="module")
+def case_dict_variants_text():
+    return CaseSnapshot(
+        case_id="CASE:004",
+        patient_id="PT-004",
+        cancer_type="nsclc",
+        variants=[{"gene": "BRAF", "variant": "V600E"}],
+        text_summary="Test case.",
+    ).to_embedding_text()
 
 
 class TestCaseSnapshot:
@@ -500,27 +581,11 @@ class TestCaseSnapshot:
         assert len(case.variants) == 1
         assert case.variants[0]["gene"] == "EGFR"
 
-    def test_embedding_text_with_string_variants(self):
-        case = CaseSnapshot(
-            case_id="CASE:003",
-            patient_id="PT-003",
-            cancer_type="nsclc",
-            variants=["EGFR L858R"],
-            text_summary="Test case.",
-        )
-        text = case.to_embedding_text()
-        assert "EGFR L858R" in text
+    def test_embedding_text_with_string_variants(self, case_string_variants_text):
+        assert "EGFR L858R" in case_string_variants_text
 
-    def test_embedding_text_with_dict_variants(self):
-        case = CaseSnapshot(
-            case_id="CASE:004",
-            patient_id="PT-004",
-            cancer_type="nsclc",
-            variants=[{"gene": "BRAF", "variant": "V600E"}],
-            text_summary="Test case.",
-        )
-        text = case.to_embedding_text()
-        assert "BRAF" in text
+    def test_embedding_text_with_dict_variants(self, case_dict_variants_text):
+        assert "BRAF" in case_dict_variants_text
 
     def test_default_text_summary(self):
         case = CaseSnapshot(
@@ -531,6 +596,7 @@ class TestCaseSnapshot:
         assert case.text_summary == ""
 
 
+@pytest.mark.usefixtures("frozen_now")
 class TestMTBPacket:
     """Test MTBPacket creation."""
 
@@ -548,7 +614,8 @@ class TestMTBPacket:
         assert packet.case_id == "CASE:001"
         assert len(packet.variant_table) == 1
         assert len(packet.therapy_ranking) == 1
-        assert isinstance(packet.generated_at, datetime)
+        assert type(packet.generated_at) is datetime
+        assert packet.generated_at == _FROZEN_NOW
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -559,49 +626,52 @@ class TestMTBPacket:
 class TestSearchHit:
     """Test SearchHit creation."""
 
-    def test_creation(self):
-        hit = SearchHit(
-            collection="onco_variants",
-            id="CIViC:12",
-            score=0.91,
-            text="EGFR L858R is a sensitising mutation.",
-            metadata={"gene": "EGFR"},
-        )
-        assert hit.collection == "onco_variants"
-        assert hit.score == 0.91
-        assert hit.metadata["gene"] == "EGFR"
-
-    def test_default_metadata(self):
-        hit = SearchHit(collection="onco_literature", id="x", score=0.5, text="test")
-        assert hit.metadata == {}
+    @pytest.mark.parametrize("kwargs,expected", [
+        pytest.param(
+            dict(
+                collection="onco_variants",
+                id="CIViC:12",
+                score=0.91,
+                text="EGFR L858R is a sensitising mutation.",
+                metadata={"gene": "EGFR"},
+            ),
+            {"collection": "onco_variants", "score": 0.91, "metadata": {"gene": "EGFR"}},
+            id="creation",
+        ),
+        pytest.param(
+            dict(collection="onco_literature", id="x", score=0.5, text="test"),
+            {"metadata": {}},
+            id="default_metadata",
+        ),
+    ])
+    def test_search_hit(self, kwargs, expected):
+        hit = SearchHit(**kwargs)
+        assert {attr: getattr(hit, attr) for attr in expected} == expected
+
+
+@pytest.fixture(scope="module")
+def cross_result():
+    return CrossCollectionResult(
+        query="BRAF V600E therapy",
+        hits=[
+            SearchHit(collection="onco_variants", id="v1", score=0.9, text="a"),
+            SearchHit(collection="onco_variants", id="v2", score=0.8, text="b"),
+            SearchHit(collection="onco_therapies", id="t1", score=0.7, text="c"),
+        ],
+        total_collections_searched=2,
+        search_time_ms=15.0,
+    )
 
 
 class TestCrossCollectionResult:
     """Test CrossCollectionResult creation and helper methods."""
 
-    def test_creation(self):
-        result = CrossCollectionResult(
-            query="BRAF V600E therapy",
-            hits=[
-                SearchHit(collection="onco_variants", id="v1", score=0.9, text="t1"),
-                SearchHit(collection="onco_therapies", id="t1", score=0.8, text="t2"),
-            ],
-            total_collections_searched=2,
-            search_time_ms=15.0,
-        )
-        assert result.hit_count == 2
-        assert result.query == "BRAF V600E therapy"
-
-    def test_hits_by_collection(self):
-        result = CrossCollectionResult(
-            query="test",
-            hits=[
-                SearchHit(collection="onco_variants", id="v1", score=0.9, text="a"),
-                SearchHit(collection="onco_variants", id="v2", score=0.8, text="b"),
-                SearchHit(collection="onco_therapies", id="t1", score=0.7, text="c"),
-            ],
-        )
-        grouped = result.hits_by_collection()
+    def test_creation(self, cross_result):
+        assert cross_result.hit_count == 3
+        assert cross_result.query == "BRAF V600E therapy"
+
+    def test_hits_by_collection(self, cross_result):
+        grouped = cross_result.hits_by_collection()
         assert len(grouped["onco_variants"]) == 2
         assert len(grouped["onco_therapies"]) == 1
 
@@ -624,6 +694,7 @@ class TestAgentQuery:
         assert q.gene == "BRAF"
 
 
+@pytest.mark.usefixtures("frozen_now")
 class TestAgentResponse:
     """Test AgentResponse creation."""
 
@@ -637,5 +708,6 @@ class TestAgentResponse:
         )
         assert resp.question == "What is EGFR?"
         assert resp.answer.startswith("EGFR")
-        assert isinstance(resp.timestamp, datetime)
+        assert type(resp.timestamp) is datetime
+        assert resp.timestamp == _FROZEN_NOW
         assert "ACTIONABLE_TARGETS" in resp.knowledge_used
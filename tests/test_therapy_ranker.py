@@ -7,53 +7,108 @@ and biomarker-driven therapy identification.
 All external dependencies (Milvus, embeddings) are mocked.
 """
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock
-
 import pytest
 
-_AGENT_ROOT = Path(__file__).resolve().parents[1]
-if str(_AGENT_ROOT) not in sys.path:
-    sys.path.insert(0, str(_AGENT_ROOT))
-
 from src.therapy_ranker import EVIDENCE_LEVEL_ORDER, TherapyRanker
 from src.knowledge import RESISTANCE_MAP
 
+# Osimertinib resistance mutations, resolved once at collection time
+_OSI_TRIGGERS = [m["mutation"] for m in RESISTANCE_MAP.get("osimertinib", [])]
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Fixtures
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-@pytest.fixture
-def therapy_ranker(mock_collection_manager, mock_embedder):
-    """Create a TherapyRanker with mocked dependencies."""
-    mock_knowledge = MagicMock()
+@pytest.fixture(scope="module")
+def therapy_ranker(static_collection_manager, mock_embedder, mock_knowledge):
+    """TherapyRanker with stub dependencies, shared by the whole module.
+
+    Ranking only reads its dependencies, so one instance serves every test.
+    """
     return TherapyRanker(
-        collection_manager=mock_collection_manager,
+        collection_manager=static_collection_manager,
         embedder=mock_embedder,
         knowledge=mock_knowledge,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def ranker(therapy_ranker):
+    """Alias used by the tests of private ranking helpers."""
+    return therapy_ranker
+
+
+@pytest.fixture(scope="module")
 def egfr_variants():
-    """Sample variants for EGFR-mutant NSCLC."""
+    """Sample variants for EGFR-mutant NSCLC (read-only)."""
     return [
         {"gene": "EGFR", "variant": "L858R"},
         {"gene": "TP53", "variant": "R175H"},
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def braf_variants():
-    """Sample variants for BRAF-mutant melanoma."""
+    """Sample variants for BRAF-mutant melanoma (read-only)."""
     return [
         {"gene": "BRAF", "variant": "V600E"},
     ]
 
 
+# Ranking results are read-only, so each distinct set of inputs is ranked
+# once per module and shared by every test that inspects it
+@pytest.fixture(scope="module")
+def egfr_ranking_result(therapy_ranker, egfr_variants):
+    return therapy_ranker.rank_therapies(
+        cancer_type="NSCLC",
+        variants=egfr_variants,
+        biomarkers={},
+    )
+
+
+@pytest.fixture(scope="module")
+def braf_ranking_result(therapy_ranker, braf_variants):
+    return therapy_ranker.rank_therapies(
+        cancer_type="melanoma",
+        variants=braf_variants,
+        biomarkers={},
+    )
+
+
+@pytest.fixture(scope="module")
+def egfr_drug_name_set(egfr_ranking_result):
+    """Lowercased drug names from the EGFR ranking."""
+    return {t.get("drug_name", "").lower() for t in egfr_ranking_result}
+
+
+@pytest.fixture(scope="module")
+def braf_drug_name_set(braf_ranking_result):
+    """Lowercased drug names from the BRAF ranking."""
+    return {t.get("drug_name", "").lower() for t in braf_ranking_result}
+
+
+@pytest.fixture(scope="module")
+def mixed_ranking_result(therapy_ranker, egfr_variants, braf_variants):
+    """EGFR and BRAF variants together, mixing evidence levels."""
+    return therapy_ranker.rank_therapies(
+        cancer_type="NSCLC",
+        variants=[egfr_variants[0], *braf_variants],
+        biomarkers={},
+    )
+
+
+@pytest.fixture(scope="module")
+def erlotinib_pretreated_ranking_result(therapy_ranker, egfr_variants):
+    return therapy_ranker.rank_therapies(
+        cancer_type="NSCLC",
+        variants=egfr_variants,
+        biomarkers={},
+        prior_therapies=["erlotinib"],
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Initialization Tests
 # ═══════════════════════════════════════════════════════════════════════════
@@ -62,8 +117,7 @@ def braf_variants():
 class TestTherapyRankerInit:
     """Test TherapyRanker initialization."""
 
-    def test_basic_init(self, mock_collection_manager, mock_embedder):
-        mock_knowledge = MagicMock()
+    def test_basic_init(self, mock_collection_manager, mock_embedder, mock_knowledge):
         ranker = TherapyRanker(
             collection_manager=mock_collection_manager,
             embedder=mock_embedder,
@@ -73,18 +127,6 @@ class TestTherapyRankerInit:
         assert ranker.embedder is mock_embedder
         assert ranker.knowledge is mock_knowledge
 
-    def test_evidence_level_order_defined(self):
-        """EVIDENCE_LEVEL_ORDER should define ordering for A through E."""
-        assert EVIDENCE_LEVEL_ORDER["A"] < EVIDENCE_LEVEL_ORDER["B"]
-        assert EVIDENCE_LEVEL_ORDER["B"] < EVIDENCE_LEVEL_ORDER["C"]
-        assert EVIDENCE_LEVEL_ORDER["C"] < EVIDENCE_LEVEL_ORDER["D"]
-        assert EVIDENCE_LEVEL_ORDER["D"] < EVIDENCE_LEVEL_ORDER["E"]
-
-    def test_evidence_level_order_has_vus(self):
-        """EVIDENCE_LEVEL_ORDER should include VUS at the lowest priority."""
-        assert "VUS" in EVIDENCE_LEVEL_ORDER
-        assert EVIDENCE_LEVEL_ORDER["VUS"] > EVIDENCE_LEVEL_ORDER["E"]
-
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Rank Therapies Tests
@@ -94,65 +136,36 @@ class TestTherapyRankerInit:
 class TestRankTherapies:
     """Test rank_therapies returns ordered results."""
 
-    def test_returns_list(self, therapy_ranker, egfr_variants):
+    def test_returns_list(self, egfr_ranking_result):
         """rank_therapies should return a list."""
-        results = therapy_ranker.rank_therapies(
-            cancer_type="NSCLC",
-            variants=egfr_variants,
-            biomarkers={},
-        )
-        assert isinstance(results, list)
+        assert isinstance(egfr_ranking_result, list)
 
-    def test_egfr_therapies_identified(self, therapy_ranker, egfr_variants):
+    def test_egfr_therapies_identified(self, egfr_drug_name_set):
         """EGFR-mutant NSCLC should identify EGFR-targeted therapies."""
-        results = therapy_ranker.rank_therapies(
-            cancer_type="NSCLC",
-            variants=egfr_variants,
-            biomarkers={},
-        )
-        drug_names = [t.get("drug_name", "").lower() for t in results]
         # At least one EGFR-targeted drug should be identified
         egfr_drugs = {"osimertinib", "erlotinib", "gefitinib", "afatinib"}
-        found = egfr_drugs & set(drug_names)
-        if len(results) > 0:
-            assert len(found) >= 1, (
-                f"Expected at least one EGFR drug, got: {drug_names}"
+        if egfr_drug_name_set:
+            assert egfr_drugs & egfr_drug_name_set, (
+                f"Expected at least one EGFR drug, got: {sorted(egfr_drug_name_set)}"
             )
 
-    def test_braf_therapies_identified(self, therapy_ranker, braf_variants):
+    def test_braf_therapies_identified(self, braf_drug_name_set):
         """BRAF V600E should identify BRAF-targeted therapies."""
-        results = therapy_ranker.rank_therapies(
-            cancer_type="melanoma",
-            variants=braf_variants,
-            biomarkers={},
-        )
-        drug_names = [t.get("drug_name", "").lower() for t in results]
         braf_drugs = {"vemurafenib", "dabrafenib", "encorafenib"}
-        found = braf_drugs & set(drug_names)
-        if len(results) > 0:
-            assert len(found) >= 1, (
-                f"Expected at least one BRAF drug, got: {drug_names}"
+        if braf_drug_name_set:
+            assert braf_drugs & braf_drug_name_set, (
+                f"Expected at least one BRAF drug, got: {sorted(braf_drug_name_set)}"
             )
 
-    def test_results_have_rank(self, therapy_ranker, egfr_variants):
+    def test_results_have_rank(self, egfr_ranking_result):
         """Each result should have a 'rank' field."""
-        results = therapy_ranker.rank_therapies(
-            cancer_type="NSCLC",
-            variants=egfr_variants,
-            biomarkers={},
-        )
-        for result in results:
+        for result in egfr_ranking_result:
             assert "rank" in result
             assert isinstance(result["rank"], int)
 
-    def test_results_have_evidence_level(self, therapy_ranker, egfr_variants):
+    def test_results_have_evidence_level(self, egfr_ranking_result):
         """Each result should have an 'evidence_level' field."""
-        results = therapy_ranker.rank_therapies(
-            cancer_type="NSCLC",
-            variants=egfr_variants,
-            biomarkers={},
-        )
-        for result in results:
+        for result in egfr_ranking_result:
             assert "evidence_level" in result
 
 
@@ -164,36 +177,16 @@ class TestRankTherapies:
 class TestEvidenceLevelSorting:
     """Test evidence level sorting (A > B > C > D)."""
 
-    def test_level_a_before_level_b(self):
-        """Level A should sort before Level B."""
-        assert EVIDENCE_LEVEL_ORDER["A"] < EVIDENCE_LEVEL_ORDER["B"]
-
-    def test_level_b_before_level_c(self):
-        """Level B should sort before Level C."""
-        assert EVIDENCE_LEVEL_ORDER["B"] < EVIDENCE_LEVEL_ORDER["C"]
+    def test_levels_ordered_a_to_e_then_vus(self):
+        """EVIDENCE_LEVEL_ORDER should rank A through E strictly, then VUS last."""
+        order = [EVIDENCE_LEVEL_ORDER[level] for level in ("A", "B", "C", "D", "E", "VUS")]
+        assert order == sorted(order)
+        assert len(set(order)) == len(order)
 
-    def test_level_c_before_level_d(self):
-        """Level C should sort before Level D."""
-        assert EVIDENCE_LEVEL_ORDER["C"] < EVIDENCE_LEVEL_ORDER["D"]
-
-    def test_level_d_before_level_e(self):
-        """Level D should sort before Level E."""
-        assert EVIDENCE_LEVEL_ORDER["D"] < EVIDENCE_LEVEL_ORDER["E"]
-
-    def test_ranking_order_matches_evidence_level(self, therapy_ranker):
+    def test_ranking_order_matches_evidence_level(self, mixed_ranking_result):
         """Therapies with stronger evidence should rank higher (lower rank number)."""
-        # Mix of evidence levels
-        variants = [
-            {"gene": "EGFR", "variant": "L858R"},
-            {"gene": "BRAF", "variant": "V600E"},
-        ]
-        results = therapy_ranker.rank_therapies(
-            cancer_type="NSCLC",
-            variants=variants,
-            biomarkers={},
-        )
         # Verify ordering: clean (non-flagged) therapies should be sorted by evidence level
-        clean_results = [r for r in results if not r.get("resistance_flag") and not r.get("contraindication_flag")]
+        clean_results = [r for r in mixed_ranking_result if not r.get("resistance_flag") and not r.get("contraindication_flag")]
         for i in range(len(clean_results) - 1):
             level_i = EVIDENCE_LEVEL_ORDER.get(clean_results[i].get("evidence_level", "E"), 4)
             level_next = EVIDENCE_LEVEL_ORDER.get(clean_results[i + 1].get("evidence_level", "E"), 4)
@@ -208,10 +201,6 @@ class TestEvidenceLevelSorting:
 class TestResistanceChecking:
     """Test resistance checking flags known mechanisms."""
 
-    @pytest.fixture
-    def ranker(self, therapy_ranker):
-        return therapy_ranker
-
     def test_no_resistance_without_prior(self, ranker):
         """No resistance should be flagged without prior therapies."""
         result = ranker._check_resistance("osimertinib", [])
@@ -219,37 +208,22 @@ class TestResistanceChecking:
 
     def test_resistance_with_matching_prior(self, ranker):
         """Resistance should be flagged when prior therapy triggers it."""
-        # Check if osimertinib has resistance triggers in RESISTANCE_MAP
-        if "osimertinib" in RESISTANCE_MAP:
-            triggers = RESISTANCE_MAP["osimertinib"]
-            if triggers:
-                # Use a known trigger
-                triggers[0].get("mutation", "")
-                # The _check_resistance method checks if prior therapies
-                # match resistance triggers, which is drug-based not mutation-based
-                # So we test with a valid scenario
-                pass
-
-    def test_resistance_flag_in_ranking(self, therapy_ranker, egfr_variants):
+        # Osimertinib has resistance triggers in RESISTANCE_MAP (_OSI_TRIGGERS)
+        if _OSI_TRIGGERS:
+            # The _check_resistance method checks if prior therapies
+            # match resistance triggers, which is drug-based not mutation-based
+            # So we test with a valid scenario
+            pass
+
+    def test_resistance_flag_in_ranking(self, erlotinib_pretreated_ranking_result):
         """Therapies with resistance flags should appear after clean therapies."""
-        results = therapy_ranker.rank_therapies(
-            cancer_type="NSCLC",
-            variants=egfr_variants,
-            biomarkers={},
-            prior_therapies=["erlotinib"],
-        )
         # All results should have resistance_flag field
-        for result in results:
+        for result in erlotinib_pretreated_ranking_result:
             assert "resistance_flag" in result
 
-    def test_contraindication_flag_exists(self, therapy_ranker, egfr_variants):
+    def test_contraindication_flag_exists(self, egfr_ranking_result):
         """Contraindication flag should exist in results."""
-        results = therapy_ranker.rank_therapies(
-            cancer_type="NSCLC",
-            variants=egfr_variants,
-            biomarkers={},
-        )
-        for result in results:
+        for result in egfr_ranking_result:
             assert "contraindication_flag" in result
 
 
@@ -261,57 +235,30 @@ class TestResistanceChecking:
 class TestBiomarkerDrivenTherapy:
     """Test _identify_biomarker_therapies for known biomarker-therapy pairs."""
 
-    @pytest.fixture
-    def ranker(self, therapy_ranker):
-        return therapy_ranker
-
-    def test_msi_h_identifies_pembrolizumab(self, ranker):
-        """MSI-H should identify pembrolizumab."""
-        therapies = ranker._identify_biomarker_therapies(
-            biomarkers={"MSI": "MSI-H"},
-            cancer_type="colorectal",
-        )
-        drug_names = [t.get("drug_name", "").lower() for t in therapies]
-        assert "pembrolizumab" in drug_names
-
-    def test_tmb_h_identifies_pembrolizumab(self, ranker):
-        """TMB-H (>=10) should identify pembrolizumab."""
-        therapies = ranker._identify_biomarker_therapies(
-            biomarkers={"TMB": 15.0},
-            cancer_type="NSCLC",
-        )
-        drug_names = [t.get("drug_name", "").lower() for t in therapies]
-        assert "pembrolizumab" in drug_names
-
-    def test_hrd_identifies_parp_inhibitors(self, ranker):
-        """HRD-positive should identify PARP inhibitors."""
-        therapies = ranker._identify_biomarker_therapies(
-            biomarkers={"HRD": True},
-            cancer_type="ovarian",
-        )
-        drug_names = [t.get("drug_name", "").lower() for t in therapies]
-        parp_drugs = {"olaparib", "rucaparib", "niraparib"}
-        found = parp_drugs & set(drug_names)
-        assert len(found) >= 1
-
-    def test_pdl1_high_identifies_pembrolizumab(self, ranker):
-        """PD-L1 TPS >= 50% should identify pembrolizumab."""
+    @pytest.mark.parametrize("biomarkers,cancer_type,expected,min_found", [
+        pytest.param({"MSI": "MSI-H"}, "colorectal", {"pembrolizumab"}, 1, id="msi_h"),
+        pytest.param({"TMB": 15.0}, "NSCLC", {"pembrolizumab"}, 1, id="tmb_h"),
+        pytest.param(
+            {"HRD": True}, "ovarian", {"olaparib", "rucaparib", "niraparib"}, 1, id="hrd",
+        ),
+        pytest.param({"PD-L1_TPS": 80}, "NSCLC", {"pembrolizumab"}, 1, id="pdl1_high"),
+        pytest.param(
+            {"NTRK": "fusion"}, "tissue-agnostic", {"larotrectinib", "entrectinib"}, 2,
+            id="ntrk_fusion",
+        ),
+    ])
+    def test_biomarker_identifies_therapies(
+        self, ranker, biomarkers, cancer_type, expected, min_found
+    ):
+        """Each biomarker should surface at least ``min_found`` of its expected drugs."""
         therapies = ranker._identify_biomarker_therapies(
-            biomarkers={"PD-L1_TPS": 80},
-            cancer_type="NSCLC",
+            biomarkers=biomarkers,
+            cancer_type=cancer_type,
         )
-        drug_names = [t.get("drug_name", "").lower() for t in therapies]
-        assert "pembrolizumab" in drug_names
-
-    def test_ntrk_fusion_identifies_trk_inhibitors(self, ranker):
-        """NTRK fusion should identify larotrectinib and entrectinib."""
-        therapies = ranker._identify_biomarker_therapies(
-            biomarkers={"NTRK": "fusion"},
-            cancer_type="tissue-agnostic",
+        drug_names = {t.get("drug_name", "").lower() for t in therapies}
+        assert len(expected & drug_names) >= min_found, (
+            f"Expected {min_found} of {sorted(expected)}, got: {sorted(drug_names)}"
         )
-        drug_names = [t.get("drug_name", "").lower() for t in therapies]
-        assert "larotrectinib" in drug_names
-        assert "entrectinib" in drug_names
 
     def test_no_biomarkers_returns_empty(self, ranker):
         """Empty biomarkers should return empty list."""
@@ -330,10 +277,6 @@ class TestBiomarkerDrivenTherapy:
 class TestAssignFinalRanks:
     """Test _assign_final_ranks puts clean therapies before flagged ones."""
 
-    @pytest.fixture
-    def ranker(self, therapy_ranker):
-        return therapy_ranker
-
     def test_clean_before_flagged(self, ranker):
         """Clean therapies should appear before resistance-flagged therapies."""
         therapies = [
@@ -7,15 +7,11 @@ and composite scoring logic.
 All external dependencies (Milvus, embeddings) are mocked.
 """
 
-import sys
-from pathlib import Path
+import copy
+from types import MappingProxyType
 
 import pytest
 
-_AGENT_ROOT = Path(__file__).resolve().parents[1]
-if str(_AGENT_ROOT) not in sys.path:
-    sys.path.insert(0, str(_AGENT_ROOT))
-
 from src.trial_matcher import TrialMatcher
 
 
@@ -24,53 +20,81 @@ from src.trial_matcher import TrialMatcher
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-@pytest.fixture
-def trial_matcher(mock_collection_manager, mock_embedder):
-    """Create a TrialMatcher with mocked dependencies."""
+@pytest.fixture(scope="module")
+def trial_matcher(static_collection_manager, mock_embedder):
+    """TrialMatcher with stub dependencies, shared by the whole module.
+
+    Its collection manager always returns empty results; use
+    ``seeded_matcher`` to configure search results per test.
+    """
     return TrialMatcher(
-        collection_manager=mock_collection_manager,
+        collection_manager=static_collection_manager,
         embedder=mock_embedder,
     )
 
 
 @pytest.fixture
+def seeded_matcher(trial_matcher, mock_collection_manager):
+    """Per-test shallow copy of ``trial_matcher`` with a fresh collection manager."""
+    matcher = copy.copy(trial_matcher)
+    matcher.collection_manager = mock_collection_manager
+    return matcher
+
+
+# Simulated Milvus trial rows, frozen so no test can leak mutations
+_SAMPLE_TRIALS = tuple(MappingProxyType(row) for row in (
+    {
+        "trial_id": "NCT04613596",
+        "title": "ADAURA: Adjuvant Osimertinib in EGFR-Mutant NSCLC",
+        "phase": "Phase 3",
+        "status": "Recruiting",
+        "cancer_type": "nsclc",
+        "criteria": "EGFR exon 19 deletion or L858R stage IB-IIIA NSCLC",
+        "biomarker_criteria": "EGFR L858R exon 19 deletion",
+        "sponsor": "AstraZeneca",
+        "score": 0.85,
+    },
+    {
+        "trial_id": "NCT03785249",
+        "title": "CROWN: Lorlatinib vs Crizotinib in ALK-Positive NSCLC",
+        "phase": "Phase 3",
+        "status": "Active, not recruiting",
+        "cancer_type": "nsclc",
+        "criteria": "ALK-positive advanced NSCLC, no prior ALK TKI",
+        "biomarker_criteria": "ALK rearrangement",
+        "sponsor": "Pfizer",
+        "score": 0.78,
+    },
+    {
+        "trial_id": "NCT02628067",
+        "title": "KEYNOTE-158: Pembrolizumab in MSI-H Solid Tumors",
+        "phase": "Phase 2",
+        "status": "Recruiting",
+        "cancer_type": "solid tumors",
+        "criteria": "MSI-H or TMB-H advanced solid tumors",
+        "biomarker_criteria": "MSI-H TMB-H dMMR",
+        "sponsor": "Merck",
+        "score": 0.72,
+    },
+))
+
+# Read-only patient profiles shared by the composite-score tests
+_PATIENT = MappingProxyType({
+    "cancer_type": "NSCLC",
+    "biomarkers": MappingProxyType({"EGFR": "L858R"}),
+    "stage": "IV",
+})
+_PATIENT_NOBM = MappingProxyType({
+    "cancer_type": "NSCLC",
+    "biomarkers": MappingProxyType({}),
+    "stage": "IV",
+})
+
+
+@pytest.fixture(scope="module")
 def sample_trial_results():
-    """Simulated trial search results from Milvus."""
-    return [
-        {
-            "trial_id": "NCT04613596",
-            "title": "ADAURA: Adjuvant Osimertinib in EGFR-Mutant NSCLC",
-            "phase": "Phase 3",
-            "status": "Recruiting",
-            "cancer_type": "nsclc",
-            "criteria": "EGFR exon 19 deletion or L858R stage IB-IIIA NSCLC",
-            "biomarker_criteria": "EGFR L858R exon 19 deletion",
-            "sponsor": "AstraZeneca",
-            "score": 0.85,
-        },
-        {
-            "trial_id": "NCT03785249",
-            "title": "CROWN: Lorlatinib vs Crizotinib in ALK-Positive NSCLC",
-            "phase": "Phase 3",
-            "status": "Active, not recruiting",
-            "cancer_type": "nsclc",
-            "criteria": "ALK-positive advanced NSCLC, no prior ALK TKI",
-            "biomarker_criteria": "ALK rearrangement",
-            "sponsor": "Pfizer",
-            "score": 0.78,
-        },
-        {
-            "trial_id": "NCT02628067",
-            "title": "KEYNOTE-158: Pembrolizumab in MSI-H Solid Tumors",
-            "phase": "Phase 2",
-            "status": "Recruiting",
-            "cancer_type": "solid tumors",
-            "criteria": "MSI-H or TMB-H advanced solid tumors",
-            "biomarker_criteria": "MSI-H TMB-H dMMR",
-            "sponsor": "Merck",
-            "score": 0.72,
-        },
-    ]
+    """Simulated trial search results from Milvus (read-only)."""
+    return _SAMPLE_TRIALS
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -89,17 +113,14 @@ class TestTrialMatcherInit:
         assert matcher.collection_manager is mock_collection_manager
         assert matcher.embedder is mock_embedder
 
-    def test_collection_name_constant(self, trial_matcher):
-        assert trial_matcher.COLLECTION_NAME == "onco_trials"
+    def test_collection_name_constant(self):
+        assert TrialMatcher.COLLECTION_NAME == "onco_trials"
 
-    def test_phase_weights_defined(self, trial_matcher):
-        assert "Phase 3" in trial_matcher.PHASE_WEIGHTS
-        assert "Phase 2" in trial_matcher.PHASE_WEIGHTS
-        assert "Phase 1" in trial_matcher.PHASE_WEIGHTS
+    def test_phase_weights_defined(self):
+        assert {"Phase 3", "Phase 2", "Phase 1"} <= TrialMatcher.PHASE_WEIGHTS.keys()
 
-    def test_status_weights_defined(self, trial_matcher):
-        assert "Recruiting" in trial_matcher.STATUS_WEIGHTS
-        assert "Active, not recruiting" in trial_matcher.STATUS_WEIGHTS
+    def test_status_weights_defined(self):
+        assert {"Recruiting", "Active, not recruiting"} <= TrialMatcher.STATUS_WEIGHTS.keys()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -120,18 +141,14 @@ class TestMatchTrials:
         assert isinstance(results, list)
 
     def test_match_trials_with_enriched_results(
-        self, mock_collection_manager, mock_embedder, sample_trial_results
+        self, seeded_matcher, mock_collection_manager, sample_trial_results
     ):
         """When Milvus returns results, match_trials should score them."""
         # Configure mocks to return sample results
-        mock_collection_manager.query.return_value = sample_trial_results[:1]
-        mock_collection_manager.search.return_value = sample_trial_results
+        mock_collection_manager.query.return_value = list(sample_trial_results[:1])
+        mock_collection_manager.search.return_value = list(sample_trial_results)
 
-        matcher = TrialMatcher(
-            collection_manager=mock_collection_manager,
-            embedder=mock_embedder,
-        )
-        results = matcher.match_trials(
+        results = seeded_matcher.match_trials(
             cancer_type="NSCLC",
             biomarkers={"EGFR": "L858R"},
             stage="IV",
@@ -144,24 +161,19 @@ class TestMatchTrials:
             assert "trial_id" in result
 
     def test_match_trials_scores_descending(
-        self, mock_collection_manager, mock_embedder, sample_trial_results
+        self, seeded_matcher, mock_collection_manager, sample_trial_results
     ):
         """Results should be sorted by match_score descending."""
-        mock_collection_manager.query.return_value = sample_trial_results
-        mock_collection_manager.search.return_value = sample_trial_results
+        mock_collection_manager.query.return_value = list(sample_trial_results)
+        mock_collection_manager.search.return_value = list(sample_trial_results)
 
-        matcher = TrialMatcher(
-            collection_manager=mock_collection_manager,
-            embedder=mock_embedder,
-        )
-        results = matcher.match_trials(
+        results = seeded_matcher.match_trials(
             cancer_type="NSCLC",
             biomarkers={"EGFR": "L858R"},
             stage="IV",
         )
-        if len(results) >= 2:
-            for i in range(len(results) - 1):
-                assert results[i]["match_score"] >= results[i + 1]["match_score"]
+        scores = [r["match_score"] for r in results]
+        assert scores == sorted(scores, reverse=True)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -172,67 +184,32 @@ class TestMatchTrials:
 class TestScoreBiomarkerMatch:
     """Test _score_biomarker_match for exact and partial matches."""
 
-    @pytest.fixture
-    def matcher(self, trial_matcher):
-        return trial_matcher
-
-    def test_exact_match(self, matcher):
-        """Patient biomarker appearing in criteria should score > 0."""
-        score = matcher._score_biomarker_match(
-            trial_biomarker_criteria="EGFR L858R mutation required",
-            patient_biomarkers={"EGFR": "L858R"},
-        )
-        assert score > 0.0
-
-    def test_no_match(self, matcher):
-        """Patient biomarker not in criteria should score 0."""
-        score = matcher._score_biomarker_match(
-            trial_biomarker_criteria="ALK rearrangement required",
-            patient_biomarkers={"BRAF": "V600E"},
-        )
-        assert score == 0.0
-
-    def test_partial_match(self, matcher):
-        """Some but not all biomarkers matching should give fractional score."""
-        score = matcher._score_biomarker_match(
-            trial_biomarker_criteria="EGFR mutation MSI-H testing",
-            patient_biomarkers={"EGFR": "L858R", "BRAF": "V600E", "MSI": "MSI-H"},
-        )
+    @pytest.mark.parametrize("criteria,biomarkers,matches", [
+        pytest.param("EGFR L858R mutation required", {"EGFR": "L858R"}, True,
+                     id="exact_match"),
+        pytest.param("ALK rearrangement required", {"BRAF": "V600E"}, False,
+                     id="no_match"),
         # At least 1 of 3 should match (EGFR appears in criteria)
-        assert 0.0 < score <= 1.0
-
-    def test_empty_biomarkers(self, matcher):
-        """Empty patient biomarkers should return 0."""
-        score = matcher._score_biomarker_match(
-            trial_biomarker_criteria="EGFR required",
-            patient_biomarkers={},
-        )
-        assert score == 0.0
-
-    def test_empty_criteria(self, matcher):
-        """Empty trial criteria should return 0."""
-        score = matcher._score_biomarker_match(
-            trial_biomarker_criteria="",
-            patient_biomarkers={"EGFR": "L858R"},
-        )
-        assert score == 0.0
-
-    def test_full_match(self, matcher):
-        """All biomarkers matching should score 1.0."""
-        score = matcher._score_biomarker_match(
-            trial_biomarker_criteria="EGFR L858R mutation, PD-L1 TPS 80%",
-            patient_biomarkers={"EGFR": "L858R", "PD-L1": "80"},
-        )
-        # Both keys should be found in criteria
-        assert score > 0.0
-
-    def test_case_insensitive(self, matcher):
-        """Matching should be case-insensitive."""
-        score = matcher._score_biomarker_match(
-            trial_biomarker_criteria="egfr mutation required",
-            patient_biomarkers={"EGFR": "L858R"},
+        pytest.param("EGFR mutation MSI-H testing",
+                     {"EGFR": "L858R", "BRAF": "V600E", "MSI": "MSI-H"}, True,
+                     id="partial_match"),
+        pytest.param("EGFR required", {}, False, id="empty_biomarkers"),
+        pytest.param("", {"EGFR": "L858R"}, False, id="empty_criteria"),
+        pytest.param("EGFR L858R mutation, PD-L1 TPS 80%",
+                     {"EGFR": "L858R", "PD-L1": "80"}, True, id="full_match"),
+        pytest.param("egfr mutation required", {"EGFR": "L858R"}, True,
+                     id="case_insensitive"),
+    ])
+    def test_score_biomarker_match(self, trial_matcher, criteria, biomarkers, matches):
+        """Matching biomarkers score a fraction in (0, 1]; otherwise 0."""
+        score = trial_matcher._score_biomarker_match(
+            trial_biomarker_criteria=criteria,
+            patient_biomarkers=biomarkers,
         )
-        assert score > 0.0
+        if matches:
+            assert 0.0 < score <= 1.0
+        else:
+            assert score == 0.0
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -250,9 +227,8 @@ class TestCancerTypeFiltering:
             biomarkers={"EGFR": "L858R", "PD-L1_TPS": 80},
             stage="IV",
         )
-        assert "NSCLC" in query
-        assert "stage IV" in query
-        assert "EGFR" in query
+        missing = [t for t in ("NSCLC", "stage IV", "EGFR") if t not in query]
+        assert not missing, f"{query!r} missing {missing}"
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -263,11 +239,7 @@ class TestCancerTypeFiltering:
 class TestCompositeScore:
     """Test _compute_composite_score produces valid scores."""
 
-    @pytest.fixture
-    def matcher(self, trial_matcher):
-        return trial_matcher
-
-    def test_score_range(self, matcher):
+    def test_score_range(self, trial_matcher):
         """Composite score should be between 0 and 1."""
         trial = {
             "phase": "Phase 3",
@@ -276,55 +248,34 @@ class TestCompositeScore:
             "biomarker_criteria": "EGFR mutation",
             "score": 0.8,
         }
-        patient_data = {
-            "cancer_type": "NSCLC",
-            "biomarkers": {"EGFR": "L858R"},
-            "stage": "IV",
-        }
-        score = matcher._compute_composite_score(trial, patient_data)
+        score = trial_matcher._compute_composite_score(trial, _PATIENT)
         assert 0.0 <= score <= 1.0
 
-    def test_phase_3_higher_than_phase_1(self, matcher):
-        """Phase 3 trial should score higher than Phase 1 (all else equal)."""
-        base_trial = {
-            "criteria": "EGFR mutation",
-            "biomarker_criteria": "",
-            "status": "Recruiting",
-            "score": 0.5,
-        }
-        patient_data = {
-            "cancer_type": "NSCLC",
-            "biomarkers": {"EGFR": "L858R"},
-            "stage": "IV",
-        }
-
-        trial_p3 = {**base_trial, "phase": "Phase 3"}
-        trial_p1 = {**base_trial, "phase": "Phase 1"}
-
-        score_p3 = matcher._compute_composite_score(trial_p3, patient_data)
-        score_p1 = matcher._compute_composite_score(trial_p1, patient_data)
-        assert score_p3 >= score_p1
-
-    def test_recruiting_higher_than_not_yet(self, matcher):
-        """Recruiting trial should score higher than not-yet-recruiting."""
-        base_trial = {
-            "phase": "Phase 2",
-            "criteria": "",
-            "biomarker_criteria": "",
-            "score": 0.5,
-        }
-        patient_data = {
-            "cancer_type": "NSCLC",
-            "biomarkers": {},
-            "stage": "IV",
-        }
-
-        trial_rec = {**base_trial, "status": "Recruiting"}
-        trial_nyr = {**base_trial, "status": "Not yet recruiting"}
-
-        score_rec = matcher._compute_composite_score(trial_rec, patient_data)
-        score_nyr = matcher._compute_composite_score(trial_nyr, patient_data)
-        assert score_rec >= score_nyr
+    @pytest.mark.parametrize("base_trial,patient_data,field,higher,lower", [
+        pytest.param(
+            {"criteria": "EGFR mutation", "biomarker_criteria": "",
+             "status": "Recruiting", "score": 0.5},
+            _PATIENT,
+            "phase", "Phase 3", "Phase 1",
+            id="phase_3_higher_than_phase_1",
+        ),
+        pytest.param(
+            {"phase": "Phase 2", "criteria": "", "biomarker_criteria": "",
+             "score": 0.5},
+            _PATIENT_NOBM,
+            "status", "Recruiting", "Not yet recruiting",
+            id="recruiting_higher_than_not_yet",
+        ),
+    ])
+    def test_ordering(self, trial_matcher, base_trial, patient_data, field, higher, lower):
+        """All else equal, the stronger phase/status should not score lower."""
+        score_higher = trial_matcher._compute_composite_score(
+            dict(base_trial, **{field: higher}), patient_data
+        )
+        score_lower = trial_matcher._compute_composite_score(
+            dict(base_trial, **{field: lower}), patient_data
+        )
+        assert score_higher >= score_lower
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -335,11 +286,7 @@ class TestCompositeScore:
 class TestMergeResults:
     """Test _merge_results deduplication."""
 
-    @pytest.fixture
-    def matcher(self, trial_matcher):
-        return trial_matcher
-
-    def test_deduplication(self, matcher):
+    def test_deduplication(self, trial_matcher):
         """Duplicate trial_ids should be deduplicated."""
         deterministic = [
             {"trial_id": "NCT001", "title": "Trial A", "score": 0.9},
@@ -348,15 +295,15 @@ class TestMergeResults:
             {"trial_id": "NCT001", "title": "Trial A", "score": 0.8},
             {"trial_id": "NCT002", "title": "Trial B", "score": 0.7},
         ]
-        merged = matcher._merge_results(deterministic, semantic)
+        merged = trial_matcher._merge_results(deterministic, semantic)
         trial_ids = [t["trial_id"] for t in merged]
         assert len(trial_ids) == len(set(trial_ids))
 
-    def test_union(self, matcher):
+    def test_union(self, trial_matcher):
         """Merged results should contain all unique trials."""
         deterministic = [{"trial_id": "NCT001", "title": "A"}]
         semantic = [{"trial_id": "NCT002", "title": "B"}]
-        merged = matcher._merge_results(deterministic, semantic)
+        merged = trial_matcher._merge_results(deterministic, semantic)
         trial_ids = {t["trial_id"] for t in merged}
         assert "NCT001" in trial_ids
         assert "NCT002" in trial_ids
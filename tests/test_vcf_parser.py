@@ -0,0 +1,65 @@
+"""
+Tests for the VCF parsing utilities.
+=====================================
+Validates variant summary statistics: SNV/indel classification,
+multi-allelic ALT handling, and gene extraction from INFO fields.
+"""
+
+import pytest
+
+from src.utils.vcf_parser import summarize_variants
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Fixtures
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+_SUMMARY_VARIANTS = [
+    # SNV
+    {"ref": "A", "alt": "G", "info": "GENE=EGFR"},
+    # MNV, counted as an SNV
+    {"ref": "AC", "alt": "GT", "info": "GENEINFO=KRAS:3845"},
+    # Insertion
+    {"ref": "A", "alt": "ATG", "info": "ANN=ATG|frameshift_variant|HIGH|BRAF|ENSG01"},
+    # Deletion
+    {"ref": "ATG", "alt": "A", "info": "GENE=EGFR"},
+    # Multi-allelic: one SNV and one insertion
+    {"ref": "C", "alt": "T,CA", "info": "DP=50"},
+    # ALT padded with whitespace, still an SNV
+    {"ref": "G", "alt": " T ", "info": ""},
+]
+
+
+@pytest.fixture(scope="module")
+def summary():
+    return summarize_variants(_SUMMARY_VARIANTS)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Summary Statistics Tests
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestSummarizeVariants:
+    """Test summarize_variants counts and gene extraction."""
+
+    @pytest.mark.parametrize("key,expected", [
+        ("total", 6),
+        ("snvs", 4),
+        ("insertions", 2),
+        ("deletions", 1),
+        ("indels", 3),
+    ])
+    def test_counts(self, summary, key, expected):
+        assert summary[key] == expected
+
+    def test_genes_affected(self, summary):
+        """Genes come from GENE=, GENEINFO= and ANN= tags, deduplicated and sorted."""
+        assert summary["genes_affected"] == ["BRAF", "EGFR", "KRAS"]
+        assert summary["genes_count"] == 3
+
+    def test_empty_input(self):
+        result = summarize_variants([])
+        assert result["total"] == 0
+        assert result["genes_affected"] == []